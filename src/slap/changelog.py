@@ -19,7 +19,7 @@ if t.TYPE_CHECKING:
 
 
 def is_url(s: str) -> bool:
-    return s.startswith("http://") or s.startswith("https://")
+    return s.startswith(("http://", "https://"))
 
 
 @dataclasses.dataclass
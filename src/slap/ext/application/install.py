@@ -130,6 +130,11 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
             description="Upgrade already installed packages.",
             flag=True,
         ),
+        option(
+            "--no-deps",
+            description="Install only the dependencies declared by the projects and skip resolving their transitive "
+            "dependencies (passes <opt>--no-deps</opt> to Pip/UV). Useful if all dependencies are pinned already.",
+        ),
         option(
             "--from",
             description="Install another Slap project from the given directory.",
@@ -296,7 +301,7 @@ class InstallCommandPlugin(VenvAwareCommand, ApplicationPlugin):
             else:
                 use_uv = False
 
-        installer = PipInstaller(use_uv=use_uv, symlink_helper=self)
+        installer = PipInstaller(use_uv=use_uv, symlink_helper=self, resolve=not self.option("no-deps"))
         status_code = installer.install(dependencies, python_environment, options)
         if status_code != 0:
             return status_code
@@ -1,5 +1,7 @@
 import contextlib
+import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable
 
@@ -9,6 +11,7 @@ import build.env
 from slap.application import Application, Command, option
 from slap.install.installer import PipInstaller
 from slap.plugins import ApplicationPlugin
+from slap.project import Project
 
 
 def flatten(it: Iterable[Iterable[str]]) -> Iterable[str]:
@@ -56,6 +59,12 @@ class PublishCommandPlugin(Command, ApplicationPlugin):
         option("disable-progress-bar"),
         option("dry", "d"),
         option("build-directory", "b", flag=False),
+        option(
+            "jobs",
+            "j",
+            flag=False,
+            description="the number of projects to build concurrently (defaults to the number of CPUs)",
+        ),
     ]
 
     def __init__(self, app: Application) -> None:
@@ -75,6 +84,15 @@ class PublishCommandPlugin(Command, ApplicationPlugin):
 
         distributions: list[Path] = []
 
+        jobs_option = self.option("jobs")
+        if jobs_option is None:
+            jobs = os.cpu_count() or 1
+        elif jobs_option.isdigit() and int(jobs_option) > 0:
+            jobs = int(jobs_option)
+        else:
+            self.line_error(f"error: <opt>--jobs,-j</opt> must be a positive integer: <b>{jobs_option}</b>", "error")
+            return 1
+
         with contextlib.ExitStack() as stack:
             build_dir = self.option("build-directory")
             if build_dir is None:
@@ -87,23 +105,26 @@ class PublishCommandPlugin(Command, ApplicationPlugin):
             else:
                 isolated_env = None
 
-            for project in self.app.get_target_projects():
-                if isolated_env:
+            projects = self.app.get_target_projects()
+            if isolated_env:
+                for project in projects:
                     isolated_env.install(
                         list(flatten(PipInstaller.dependency_to_pip_arguments(x) for x in project.dependencies().build))
                     )
-                if not project.is_python_project:
-                    continue
+            projects = [project for project in projects if project.is_python_project]
 
-                self.line(f"Build <info>{project.dist_name()}</info>")
+            def _build(project: Project) -> tuple[Path, Path]:
                 builder = build.ProjectBuilder(project.directory, executable)
-
-                sdist = Path(builder.build("sdist", build_dir))
-                self.line(f"  <comment>{sdist.name}</comment>")
-                wheel = Path(builder.build("wheel", build_dir))
-                self.line(f"  <comment>{wheel.name}</comment>")
-
-                distributions += [sdist, wheel]
+                return Path(builder.build("sdist", build_dir)), Path(builder.build("wheel", build_dir))
+
+            # NOTE: The projects do not need each other's distributions to be built, and the build backends run in
+            #   subprocesses, so we can build multiple projects at the same time.
+            with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(projects)))) as executor:
+                for project, (sdist, wheel) in zip(projects, executor.map(_build, projects)):
+                    self.line(f"Build <info>{project.dist_name()}</info>")
+                    self.line(f"  <comment>{sdist.name}</comment>")
+                    self.line(f"  <comment>{wheel.name}</comment>")
+                    distributions += [sdist, wheel]
 
             if not self.option("dry"):
                 self.line("Publishing")
@@ -3,8 +3,7 @@
 import json
 import logging
 import typing as t
-
-from importlib_metadata import Distribution
+from pathlib import Path
 
 from slap.application import Application, option
 from slap.ext.application.venv import VenvAwareCommand
@@ -12,6 +11,7 @@ from slap.plugins import ApplicationPlugin
 
 if t.TYPE_CHECKING:
     from slap.python.dependency import Dependency
+    from slap.python.environment import DistributionMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ class ReportDependenciesCommand(VenvAwareCommand):
             for extra in extras:
                 requirements += project.dependencies().extra.get(extra, [])
 
-        dists_cache: dict[str, Distribution | None] = {}
+        dists_cache: dict[str, DistributionMetadata | None] = {}
         python_environment = PythonEnvironment.of("python")
         requirements = filter_dependencies(requirements, python_environment.pep508, extras)
         with tqdm.tqdm(desc="Resolving requirements graph") as progress:
@@ -67,15 +67,24 @@ class ReportDependenciesCommand(VenvAwareCommand):
         # Retrieve the license text from the distributions.
         if self.option("with-license-text"):
             for dist_name, dist_data in output["metadata"].items():
-                if (dist := dists_cache[dist_name]) is None:
+                if (dist_meta := dists_cache[dist_name]) is None:
                     continue
 
                 dist_data["license_text"] = None
-                for file in dist.files or []:
-                    if not file.parent.name.endswith(".dist-info"):
+                if not dist_meta.location or not dist_meta.location.endswith(".dist-info"):
+                    continue
+                dist_info = Path(dist_meta.location)
+
+                # NOTE: PEP 639 places license files in the `licenses/` directory. Files in deeper directories
+                #   usually belong to vendored packages, so we don't search those.
+                for directory in (dist_info, dist_info / "licenses"):
+                    if not directory.is_dir():
                         continue
-                    if file.name == "LICENSE" or file.name.startswith("LICENSE."):
-                        dist_data["license_text"] = file.read_text()
+                    for file in sorted(directory.iterdir()):
+                        if file.name == "LICENSE" or file.name.startswith("LICENSE."):
+                            dist_data["license_text"] = file.read_text()
+                            break
+                    if dist_data["license_text"] is not None:
                         break
 
         print(json.dumps(output, indent=2, sort_keys=True))
@@ -2,10 +2,10 @@ import logging
 import os
 import re
 import subprocess as sp
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from textwrap import dedent
 
 import requests
 from git.repo import Repo
@@ -15,6 +15,16 @@ from slap.plugins import RepositoryCIPlugin
 
 logger = logging.getLogger()
 
+#: The script that is used as `GIT_ASKPASS` to supply the GitHub token when pushing to the pull request branch.
+ASKPASS_SCRIPT_TEMPLATE = (
+    b"#!/bin/sh\n"
+    b'case "$1" in\n'
+    b'    Username*) echo "github-actions[bot]" ;;\n'
+    b'    Password*) echo "%s" ;;\n'
+    b"    *) exit 1 ;;\n"
+    b"esac\n"
+)
+
 
 def parse_pull_request_id(github_ref: str) -> str | None:
     """
@@ -259,9 +269,7 @@ class GithubActionsRepositoryCIPlugin(RepositoryCIPlugin):
                 self._base_ref[1],
             )
 
-            logger.info("Fetching base ref '%s/%s'", *self._base_ref)
             base_remote = self._repo.remote(self._base_ref[0])
-            base_remote.fetch(self._base_ref[1])
 
             # Make sure that there is a remote for the fork.
             try:
@@ -281,9 +289,17 @@ class GithubActionsRepositoryCIPlugin(RepositoryCIPlugin):
                 )
                 head_remote.set_url(self._pull_request.head_html_url)
 
-            logger.info("Fetching head ref '%s/%s'", *self._head_ref)
             head_remote = self._repo.remote(self._head_ref[0])
-            head_remote.fetch(self._head_ref[1] + ":" + self._head_branch)
+
+            # The base and head refs are fetched from different remotes into distinct refs, so we can do it in
+            # parallel to save the latency of one network roundtrip.
+            logger.info("Fetching base ref '%s/%s'", *self._base_ref)
+            logger.info("Fetching head ref '%s/%s'", *self._head_ref)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                base_fetch = executor.submit(base_remote.fetch, self._base_ref[1])
+                head_fetch = executor.submit(head_remote.fetch, self._head_ref[1] + ":" + self._head_branch)
+                base_fetch.result()
+                head_fetch.result()
 
             logger.info("Checking out '%s/%s' as '%s'.", *self._head_ref, self._head_branch)
             self._repo.git.checkout(self._head_branch)  # "/".join(self._head_ref[:2]), "-b", self._head_branch)
@@ -340,29 +356,26 @@ class GithubActionsRepositoryCIPlugin(RepositoryCIPlugin):
 
         # If the repository lives under a symlinked directory, Repo.index.add() will complain if an aliased
         # filename is passed instead of the real path. This is an issue for example when running unit tests
-        # on OSX where /tmp is a symlink to /private/tmp.
-        changed_files = [f.resolve() for f in changed_files]
+        # on OSX where /tmp is a symlink to /private/tmp. We pass paths relative to the (real) working tree
+        # so that gitpython does not need to resolve them again.
+        assert self._repo.working_tree_dir is not None
+        repo_root = os.path.realpath(self._repo.working_tree_dir)
+        relative_files = [os.path.relpath(os.path.realpath(f), repo_root) for f in changed_files]
 
         # Use gitpython to add files and commit.
         logger.info("Committing changes to %s/%s", *self._head_ref)
-        logger.info("Changed files: %s", ", ".join(str(f) for f in changed_files))
-        self._repo.index.add([str(f) for f in changed_files])
+        logger.info("Changed files: %s", ", ".join(relative_files))
+        self._repo.index.add(relative_files, write=True)
         self._repo.index.commit(message=commit_message, author=Actor(user_name, user_email))
 
         with TemporaryDirectory() as tmpdir:
-            askpass_script = dedent(
-                f"""
-                #!/bin/sh
-                case "$1" in
-                    Username*) echo "github-actions[bot]" ;;
-                    Password*) echo "{self._github_token}" ;;
-                    *) exit 1 ;;
-                esac
-                """
-            ).strip()
+            # The file is created with the executable mode right away, saving us a separate chmod().
             askpass = Path(tmpdir) / "askpass.sh"
-            askpass.write_text(askpass_script)
-            askpass.chmod(0o700)
+            fd = os.open(askpass, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o700)
+            try:
+                os.write(fd, ASKPASS_SCRIPT_TEMPLATE % self._github_token.encode("utf-8"))
+            finally:
+                os.close(fd)
             # logger.info("Using %s as GIT_ASKPASS, content: %s", askpass, askpass_script)
             environ = self._repo.git.environment().copy()
             self._repo.git.update_environment(GIT_ASKPASS=str(askpass))
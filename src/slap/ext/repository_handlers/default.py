@@ -1,12 +1,16 @@
 import dataclasses
+import os
 import typing as t
+import weakref
+from pathlib import Path
 
+import databind.json
 from databind.core.settings import Alias
 
 from slap.plugins import RepositoryHandlerPlugin
 from slap.project import Project
 from slap.repository import Repository, RepositoryHost
-from slap.util.fs import get_file_in_directory
+from slap.util.plugins import iter_entrypoints
 from slap.util.vcs import Vcs, detect_vcs
 
 
@@ -38,12 +42,17 @@ class DefaultRepositoryHandler(RepositoryHandlerPlugin):
         directory.
     """
 
-    def _get_config(self, repository: Repository) -> DefaultRepositoryConfig:
-        import databind.json
+    def __init__(self) -> None:
+        self._config_cache: weakref.WeakKeyDictionary[Repository, DefaultRepositoryConfig] = weakref.WeakKeyDictionary()
 
-        raw_config = repository.raw_config().get("repository", {})
-        raw_config.pop("handler", None)
-        config = databind.json.load(raw_config, DefaultRepositoryConfig)
+    def _get_config(self, repository: Repository) -> DefaultRepositoryConfig:
+        # NOTE: The raw configuration is cached by the repository, so the deserialized config is stable as well.
+        config = self._config_cache.get(repository)
+        if config is None:
+            raw_config = dict(repository.raw_config().get("repository", {}))
+            raw_config.pop("handler", None)
+            config = databind.json.load(raw_config, DefaultRepositoryConfig)
+            self._config_cache[repository] = config
         return config
 
     def matches_repository(self, repository: Repository) -> bool:
@@ -54,18 +63,17 @@ class DefaultRepositoryHandler(RepositoryHandlerPlugin):
         # if vcs is not None:
         #   repository.__init__(vcs.get_toplevel())
         #   return True
-        if get_file_in_directory(repository.directory, "readme", [], case_sensitive=False):
-            return True
-        if get_file_in_directory(repository.directory, "license", [], case_sensitive=False):
-            return True
+        # Look for a README or LICENSE file (case insensitive) in a single pass over the directory.
+        with os.scandir(repository.directory) as entries:
+            for entry in entries:
+                if entry.name.lower().startswith(("readme", "license")):
+                    return True
         return False
 
     def get_vcs(self, repository: Repository) -> Vcs | None:
         return detect_vcs(repository.directory)
 
     def get_repository_host(self, repository: Repository) -> RepositoryHost | None:
-        from slap.util.plugins import iter_entrypoints
-
         config = self._get_config(repository)
         if config.repository_host:
             return config.repository_host
@@ -75,20 +83,17 @@ class DefaultRepositoryHandler(RepositoryHandlerPlugin):
         return None
 
     def get_projects(self, repository: Repository) -> list[Project]:
-        from slap.project import Project
-
         projects = []
         if repository.pyproject_toml.exists():
             projects.append(Project(repository, repository.directory))
 
         config = self._get_config(repository)
         if config.include is None or not repository.pyproject_toml.exists():
-            for path in repository.directory.iterdir():
-                if not path.is_dir():
-                    continue
-                project = Project(repository, path)
-                if project.pyproject_toml.exists():
-                    projects.append(project)
+            # NOTE: os.scandir() gives us the file type from the directory listing without an additional stat().
+            with os.scandir(repository.directory) as entries:
+                for entry in entries:
+                    if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "pyproject.toml")):
+                        projects.append(Project(repository, Path(entry.path)))
         else:
             for subdir in config.include:
                 projects.append(Project(repository, repository.directory / subdir))
@@ -1,10 +1,19 @@
 import dataclasses
 import functools
+import json
 import logging
+import os
 import re
+import subprocess as sp
+import tempfile
+import time
+import typing as t
 from pathlib import Path
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from slap.changelog import is_url
 from slap.repository import Issue, PullRequest, Repository, RepositoryHost
@@ -12,10 +21,82 @@ from slap.repository import Issue, PullRequest, Repository, RepositoryHost
 logger = logging.getLogger(__name__)
 
 
+#: Matches a GitHub issue or pull request URL, capturing the domain, owner, repository and issue number.
+ISSUE_URL_REGEX = re.compile(r"https?://([\w\-\.]+)/(?:|.+/)([\w\-\.\_]+)/([\w\-\.\_]+)/(?:pulls?|issues)/(\d+)")
+
+#: Matches a GitHub remote URL, capturing the owner and repository name.
+REMOTE_URL_REGEX = re.compile(r"github.com[:/]([^/]+/[^/]+)?")
+
+#: The file in which GitHub username lookups are persisted across invocations of Slap.
+GITHUB_USERNAME_CACHE_FILE = Path("~/.local/slap/github-users-cache.json").expanduser()
+
+#: The number of seconds after which a cached username lookup expires.
+GITHUB_USERNAME_CACHE_TTL = 30 * 86400
+
+#: The number of seconds after which a cached lookup that found no username expires.
+GITHUB_USERNAME_CACHE_NEGATIVE_TTL = 86400
+
+#: Caches the GitHub username (or `None` if no user was found) by `(api_base_url, email)`.
+_username_cache: dict[tuple[str, str], str | None] = {}
+
+
+def _load_username_disk_cache() -> dict[str, t.Any]:
+    try:
+        with GITHUB_USERNAME_CACHE_FILE.open() as fp:
+            data = json.load(fp)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.debug("Unable to read %s: %s", GITHUB_USERNAME_CACHE_FILE, exc)
+        return {}
+    now = time.time()
+    return {key: entry for key, entry in data.items() if entry["expires"] > now}
+
+
+def _save_username_disk_cache(data: dict[str, t.Any]) -> None:
+    try:
+        GITHUB_USERNAME_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=GITHUB_USERNAME_CACHE_FILE.parent, delete=False) as fp:
+            json.dump(data, fp)
+        os.replace(fp.name, GITHUB_USERNAME_CACHE_FILE)
+    except OSError as exc:
+        logger.debug("Unable to write %s: %s", GITHUB_USERNAME_CACHE_FILE, exc)
+
+
+#: The headers that are sent with every GitHub API request.
+API_HEADERS = {"Accept": "application/vnd.github+json"}
+
+
+def _get_auth_headers(url: str) -> dict[str, str]:
+    """Returns the headers to authenticate a request to the given URL with the `GITHUB_TOKEN` environment variable
+    (which raises the rate limit). The token is only sent to `api.github.com`, never to a GitHub Enterprise host."""
+
+    token = os.environ.get("GITHUB_TOKEN")
+    if token and urlparse(url).hostname == "api.github.com":
+        return {"Authorization": f"Bearer {token}"}
+    return {}
+
+
 @functools.lru_cache()
-def github_get_username_from_email(api_base_url: str, email: str) -> str | None:
+def _get_session() -> requests.Session:
+    """Returns the session that is shared by all GitHub API requests, allowing connections to be reused."""
+
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    session.headers.update(API_HEADERS)
+    return session
+
+
+def _github_search_username(api_base_url: str, email: str) -> str | None:
     assert email, "no email address"
-    response = requests.get(f"{api_base_url}/search/users", params={"q": email})
+    url = f"{api_base_url}/search/users"
+    response = _get_session().get(url, params={"q": email}, headers=_get_auth_headers(url), timeout=(3, 10))
+    # NOTE: The search API responds with 422 for queries it refuses to process (e.g. an unusual email address).
+    #   Retrying would give the same answer, so we treat it like "no user found" to have it cached as such.
+    if response.status_code in (404, 422):
+        logger.debug("GitHub user search for %r failed with status %s", email, response.status_code)
+        return None
     response.raise_for_status()
     results = response.json()
     if not results["items"]:
@@ -23,40 +104,99 @@ def github_get_username_from_email(api_base_url: str, email: str) -> str | None:
     return results["items"][0]["login"]
 
 
+def github_get_username_from_email(api_base_url: str, email: str) -> str | None:
+    """Look up the GitHub username for an email address. Results are cached in memory and in the
+    #GITHUB_USERNAME_CACHE_FILE."""
+
+    key = (api_base_url, email)
+    if key in _username_cache:
+        return _username_cache[key]
+
+    disk_cache = _load_username_disk_cache()
+    entry = disk_cache.get(f"{api_base_url} {email}")
+    if entry is not None:
+        _username_cache[key] = entry["username"]
+        return entry["username"]
+
+    username = _github_search_username(api_base_url, email)
+    _username_cache[key] = username
+    ttl = GITHUB_USERNAME_CACHE_TTL if username else GITHUB_USERNAME_CACHE_NEGATIVE_TTL
+    disk_cache[f"{api_base_url} {email}"] = {"username": username, "expires": time.time() + ttl}
+    _save_username_disk_cache(disk_cache)
+    return username
+
+
+@functools.lru_cache(maxsize=None)
+def _detect_github_repo(directory: Path) -> str | None:
+    """Returns the GitHub `owner/repo` that the `origin` remote of the Git repository in *directory* points to. The
+    result is cached as the remote will not usually change during the lifetime of the process."""
+
+    # NOTE: This fails both outside of a Git repository and when there is no `origin` remote.
+    result = sp.run(
+        ["git", "-C", str(directory), "config", "--get", "remote.origin.url"], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+
+    url = result.stdout.strip()
+    if "github" not in url:
+        return None
+
+    match = REMOTE_URL_REGEX.search(url)
+    if not match or not match.group(1):
+        return None
+
+    repo = match.group(1)
+    if repo.endswith(".git"):
+        repo = repo[:-4]
+    return repo
+
+
 @dataclasses.dataclass
 class GithubRepositoryHost(RepositoryHost):
     #: The owner and repository name separated by a slash. If the repository is hosted on GitHub enterprise, the domain
     #: of the GHE instance must precede the owner and repository name by another slash (e.g. `ghe.io/owner/repo`).
     repo: str
 
-    def _get_base_url(self) -> str:
+    @functools.cached_property
+    def _base_url(self) -> str:
         parts = self.repo.split("/")
         if len(parts) == 3:
             return f"https://{parts[0]}"
         else:
             return "https://github.com"
 
-    def _get_api_url(self) -> str:
+    @functools.cached_property
+    def _api_url(self) -> str:
         # TODO (@NiklasRosenstein): Can we rely on GHE having an `api.` subdomain?
-        return self._get_base_url().replace("https://", "https://api.").rstrip("/")
+        return self._base_url.replace("https://", "https://api.").rstrip("/")
 
-    def _get_repo_url(self) -> str:
-        owner, repo = self._get_repo()
-        return f"{self._get_base_url()}/{owner}/{repo}"
+    @functools.cached_property
+    def _repo_url(self) -> str:
+        owner, repo = self._owner_and_repo
+        return f"{self._base_url}/{owner}/{repo}"
+
+    @functools.cached_property
+    def _owner_and_repo(self) -> tuple[str, str]:
+        rest, _, repo = self.repo.rpartition("/")
+        return rest.rpartition("/")[2], repo
+
+    @functools.cached_property
+    def _issue_url_key(self) -> tuple[str, str, str] | None:
+        """The `(domain, owner, repo)` that an issue URL must have to be considered an issue of this repository."""
 
-    def _get_repo(self) -> tuple[str, str]:
         parts = self.repo.split("/")
-        return parts[-2], parts[-1]
+        if len(parts) == 2:
+            return ("github.com", parts[0], parts[1])
+        elif len(parts) == 3:
+            return (parts[0], parts[1], parts[2])
+        return None
 
     def _get_issue_shortform(self, issue_url: str) -> str:
-        match = re.search(
-            r"https?://([\w\-\.]+)/(?:|.+/)([\w\-\.\_]+)/([\w\-\.\_]+)/(?:pulls?|issues)/(\d+)", issue_url
-        )
+        match = ISSUE_URL_REGEX.search(issue_url)
         if match:
             domain, owner, repo, issue_id = match.groups()
-            if domain == "github.com" and self.repo == (owner + "/" + repo):
-                return issue_id
-            elif self.repo == (domain + "/" + owner + "/" + repo):
+            if (domain, owner, repo) == self._issue_url_key:
                 return issue_id
             result = owner + "/" + repo + "#" + issue_id
             if domain != "github.com":
@@ -68,14 +208,15 @@ class GithubRepositoryHost(RepositoryHost):
         vcs = repository.vcs()
         assert vcs
         email = vcs.get_author().email
-        username = github_get_username_from_email(self._get_api_url(), email)
+        assert email, "no email address"
+        username = github_get_username_from_email(self._api_url, email)
         return ("@" + username) if username else None
 
     def get_issue_by_reference(self, issue_reference: str) -> Issue:
         issue_reference = issue_reference.lstrip("#")
         if issue_reference.isnumeric():
             id = issue_reference
-            url = f"{self._get_repo_url()}/issues/{issue_reference}"
+            url = f"{self._repo_url}/issues/{issue_reference}"
             shortform = "#" + id
         elif is_url(issue_reference):
             url = issue_reference
@@ -95,28 +236,8 @@ class GithubRepositoryHost(RepositoryHost):
 
     @staticmethod
     def detect_repository_host(repository: Repository) -> RepositoryHost | None:
-        from slap.util.git import Git
-
-        git = Git(repository.directory)
-        if not git.get_toplevel():
-            return None
-
-        remotes = git.remotes()
-        for remote in remotes:
-            if remote.name == "origin" and "github" in remote.fetch:
-                break
-        else:
-            return None
-
-        match = re.search(r"github.com[:/]([^/]+/[^/]+)?", remote.fetch)
-        if not match:
-            return None
-
-        repo = match.group(1)
-        if repo.endswith(".git"):
-            repo = repo[:-4]
-
-        return GithubRepositoryHost(repo)
+        repo = _detect_github_repo(repository.directory.resolve())
+        return GithubRepositoryHost(repo) if repo else None
 
     def comment_on_issue(self, issue_reference: str, message: str) -> None:
         raise NotImplementedError
@@ -5,13 +5,20 @@ from poetry.core.constraints.version import Version  # type: ignore[import]
 from slap.plugins import VersionIncrementingRulePlugin
 
 
-def incrementing_rule(func: t.Callable[[Version], Version]) -> type[VersionIncrementingRulePlugin]:
-    class _Incrementor(VersionIncrementingRulePlugin):
-        def increment_version(self, version: Version) -> Version:
-            return func(version)
+class _FunctionIncrementingRule(VersionIncrementingRulePlugin):
+    """Base class for rules that delegate to a plain function. The entrypoint API expects a type for every rule, but
+    they all share this one implementation of #increment_version()."""
+
+    func: t.ClassVar[t.Callable[[Version], Version]]
+
+    def increment_version(self, version: Version) -> Version:
+        return type(self).func(version)
 
-    _Incrementor.__name__ = func.__name__
-    return _Incrementor
+
+def incrementing_rule(func: t.Callable[[Version], Version]) -> type[VersionIncrementingRulePlugin]:
+    return type(
+        func.__name__, (_FunctionIncrementingRule,), {"func": staticmethod(func), "__module__": func.__module__}
+    )
 
 
 @incrementing_rule
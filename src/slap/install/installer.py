@@ -3,22 +3,31 @@
 from __future__ import annotations
 
 import abc
+import collections
 import dataclasses
 import logging
 import os
 import shlex
 import subprocess as sp
+import tempfile
 import typing as t
 from pathlib import Path
 from urllib.parse import unquote
 
-from slap.python.dependency import MultiDependency
+from slap.python.dependency import (
+    Dependency,
+    GitDependency,
+    MultiDependency,
+    PathDependency,
+    PypiDependency,
+    UrlDependency,
+    VersionSpec,
+)
 from slap.python.pep508 import filter_dependencies, test_dependency
 from slap.util.url import Url
 
 if t.TYPE_CHECKING:
     from slap.project import Project
-    from slap.python.dependency import Dependency
     from slap.python.environment import PythonEnvironment
 
 logger = logging.getLogger(__name__)
@@ -46,16 +55,22 @@ class IndexSpec:
         """Parses a spec for an extra index URL which must be of the form `name=...,url=https://...` and may
         additional provide values a `username=...` and `password=...`."""
 
-        values = {k.strip(): unquote(v.strip()) for k, v in (x.partition("=")[::2] for x in spec.split(","))}
-        try:
-            name = values.pop("name")
-            url = values.pop("url", None)
-            username = values.pop("username", None)
-            password = values.pop("password", None)
-        except KeyError as exc:
-            raise ValueError(f"invalid index spec {spec!r}: missing {exc}")
-        for key in values:
-            raise ValueError(f"invalid index spec {spec!r}: unrecognized key {key!r}")
+        name = url = username = password = None
+        for item in spec.split(","):
+            key, _, value = item.partition("=")
+            key = key.strip()
+            if key == "name":
+                name = unquote(value.strip())
+            elif key == "url":
+                url = unquote(value.strip())
+            elif key == "username":
+                username = unquote(value.strip())
+            elif key == "password":
+                password = unquote(value.strip())
+            else:
+                raise ValueError(f"invalid index spec {spec!r}: unrecognized key {key!r}")
+        if name is None:
+            raise ValueError(f"invalid index spec {spec!r}: missing 'name'")
         if not any((url, username, password)):
             raise ValueError(f"invalid index spec {spec!r}: need one of url, username, password")
         return cls(name, url, username, password)
@@ -111,39 +126,103 @@ class SymlinkHelper(t.Protocol):
     def link_project(self, project: Path) -> None: ...
 
 
+def _git_dependency_to_pip_arguments(dependency: GitDependency, extras: str, hashes: str) -> list[str]:
+    # TODO (@NiklasRosenstein): Add Git branch/rev/tag to the URL.
+    if dependency.branch or dependency.rev or dependency.tag:
+        logger.warning(
+            "PipInstaller does not currently support Git branch/rev/tag, dependency will be installed "
+            "from main branch: <val>%s</val>",
+            dependency,
+        )
+    return [f"{dependency.name}{extras} @ git+{dependency.url}"]
+
+
+def _path_dependency_to_pip_arguments(dependency: PathDependency, extras: str, hashes: str) -> list[str]:
+    assert not dependency.link  # We caught that case before
+    prefix = "" if dependency.path.is_absolute() else "./"
+    return (["-e"] if dependency.develop else []) + [f"{prefix}{dependency.path}{extras}"]
+
+
+def _pypi_dependency_to_pip_arguments(dependency: PypiDependency, extras: str, hashes: str) -> list[str]:
+    return [" ".join(filter(None, (f"{dependency.name}{extras}", dependency.version.to_pep_508(), hashes)))]
+
+
+def _url_dependency_to_pip_arguments(dependency: UrlDependency, extras: str, hashes: str) -> list[str]:
+    return [" ".join(filter(None, (f"{dependency.name}{extras} @ {dependency.url}", hashes)))]
+
+
+def _dependency_key(dependency: Dependency) -> t.Hashable:
+    """Returns a key that is equal for two dependencies that describe the same requirement, independent of the
+    order of their extras and hashes."""
+
+    key: list[t.Any] = [type(dependency)]
+    for field in dataclasses.fields(dependency):
+        value = getattr(dependency, field.name)
+        if field.name in ("extras", "hashes"):
+            value = frozenset(value or ())
+        elif field.name == "dependencies":
+            value = tuple(map(_dependency_key, value))
+        elif isinstance(value, VersionSpec):
+            value = str(value)
+        key.append(value)
+    return tuple(key)
+
+
 class PipInstaller(Installer):
     """Installs dependencies via Pip or Uv."""
 
-    def __init__(self, use_uv: bool = True, symlink_helper: SymlinkHelper | None = None) -> None:
+    #: The dependency types for which Pip can verify hashes.
+    _HASH_SUPPORTED: t.ClassVar[frozenset[type[Dependency]]] = frozenset({PypiDependency, UrlDependency})
+
+    #: Maps the exact type of a dependency to the function that converts it to Pip arguments. A #MultiDependency
+    #: is intentionally absent, its sub-dependencies must be converted individually.
+    _PIP_ARG_BUILDERS: t.ClassVar[dict[type[Dependency], t.Callable[[t.Any, str, str], list[str]]]] = {
+        GitDependency: _git_dependency_to_pip_arguments,
+        PathDependency: _path_dependency_to_pip_arguments,
+        PypiDependency: _pypi_dependency_to_pip_arguments,
+        UrlDependency: _url_dependency_to_pip_arguments,
+    }
+
+    def __init__(self, use_uv: bool = True, symlink_helper: SymlinkHelper | None = None, resolve: bool = True) -> None:
         """
         Args:
           symlink_helper: A helper for implementing #PathDependency.link when it is encountered. If not specified,
             an error will be raised when a #PathDependency is passed that needs to be linked.
+          resolve: If disabled, Pip (or Uv) is run with `--no-deps` and only the given dependencies are installed.
+            This skips the resolver entirely, but transitive dependencies must then be included in the list
+            already, e.g. when installing from a fully pinned set of dependencies.
         """
 
         self.use_uv = use_uv
         self.symlink_helper = symlink_helper
+        self.resolve = resolve
 
     def install(self, dependencies: t.Sequence[Dependency], target: PythonEnvironment, options: InstallOptions) -> int:
-        from slap.python.dependency import PathDependency, PypiDependency, UrlDependency
-
         # Collect the Pip arguments and the dependencies that need to be installed through other methods.
-        supports_hashes = {PypiDependency, UrlDependency}
         unsupported_hashes: dict[type[Dependency], list[Dependency]] = {}
         link_projects: list[Path] = []
+        requirements: list[str] = []
         pip_arguments: list[str] = []
         # used_indexes: set[str] = set()
-        dependencies = list(dependencies)
+        # NOTE: Sub-dependencies of a #MultiDependency are prepended to the queue, which is O(1) for a deque.
+        queue = collections.deque(dependencies)
+        seen: set[t.Hashable] = set()
+
+        while queue:
+            dependency = queue.pop()
 
-        while dependencies:
-            dependency = dependencies.pop()
+            # The same dependency may be encountered multiple times, e.g. through multiple linked projects.
+            key = _dependency_key(dependency)
+            if key in seen:
+                continue
+            seen.add(key)
 
             # TODO (@NiklasRosenstein): Pass extras from PipInstaller caller.
             if not test_dependency(dependency, target.pep508, set()):
                 continue
 
             # Collect dependencies for which hashes are not supported so we can report it later.
-            if dependency.hashes and type(dependency) not in supports_hashes:
+            if dependency.hashes and type(dependency) not in self._HASH_SUPPORTED:
                 unsupported_hashes.setdefault(type(dependency), []).append(dependency)
 
             if isinstance(dependency, PathDependency) and dependency.link:
@@ -152,7 +231,7 @@ class PipInstaller(Installer):
                     raise Exception(
                         "Unable to install %r because no symlink helper is available in this context", dependency
                     )
-                dependencies += filter_dependencies(
+                queue += filter_dependencies(
                     dependencies=self.symlink_helper.get_dependencies_for_project(dependency.path),
                     env=target.pep508,
                     extras=set(dependency.extras or []),
@@ -161,13 +240,15 @@ class PipInstaller(Installer):
                 continue
 
             if isinstance(dependency, MultiDependency):
-                for sub_dependency in dependency.dependencies:
-                    # TODO (@NiklasRosenstein): Pass extras from the caller so we can evaluate them here
-                    if test_dependency(sub_dependency, target.pep508, set()):
-                        dependencies.insert(0, sub_dependency)
+                # NOTE: The environment markers of the sub-dependencies are tested when they are popped from the queue.
+                queue.extendleft(dependency.dependencies)
 
             else:
-                pip_arguments += self.dependency_to_pip_arguments(dependency)
+                # NOTE: The requirements are passed to Pip in a file, so relative paths must not depend on where
+                #   that file is located (Pip resolves them relative to the working directory, UV does not).
+                if isinstance(dependency, PathDependency) and not dependency.path.is_absolute():
+                    dependency = dataclasses.replace(dependency, path=dependency.path.absolute())
+                requirements.append(" ".join(self.dependency_to_pip_arguments(dependency)))
 
             # if isinstance(dependency, PypiDependency) and dependency.source:
             #     used_indexes.add(dependency.source)
@@ -189,28 +270,41 @@ class PipInstaller(Installer):
         except KeyError as exc:
             raise Exception(f"PyPI index {exc} is not configured")
 
-        # Construct the Pip command to run.
-        environ = os.environ.copy()
-        if self.use_uv:
-            from slap.ext.application.venv import UvVenv
-
-            assert target.base_prefix, target
-            pip_command = [str(UvVenv.find_uv_bin()), "pip", "install"] + pip_arguments
-            environ["VIRTUAL_ENV"] = target.base_prefix
-        else:
-            pip_command = [target.executable, "-m", "pip", "install"] + pip_arguments
-        if options.quiet:
-            pip_command += ["-q"]
-        if options.upgrade:
-            pip_command += ["--upgrade"]
-
-        logger.info(
-            "Installing with %s using command <subj>$ %s</subj>",
-            "UV" if self.use_uv else "Pip",
-            " ".join(map(shlex.quote, pip_command)),
-        )
-        if (res := sp.call(pip_command)) != 0:
-            return res
+        # NOTE (@NiklasRosenstein): The requirements are written to a file instead of being passed on the command
+        #   line; that keeps us clear of command-line length limits (e.g. on Windows) for large mono-repositories, and
+        #   it is the only place where Pip accepts `--hash` options for a requirement.
+        with tempfile.NamedTemporaryFile("w", prefix="slap-requirements-", suffix=".txt", delete=False) as fp:
+            fp.write("\n".join(requirements) + "\n")
+        try:
+            pip_arguments += ["-r", fp.name]
+
+            # Construct the Pip command to run.
+            environ = os.environ.copy()
+            if self.use_uv:
+                from slap.ext.application.venv import UvVenv
+
+                assert target.base_prefix, target
+                pip_command = [str(UvVenv.find_uv_bin()), "pip", "install"] + pip_arguments
+                environ["VIRTUAL_ENV"] = target.base_prefix
+            else:
+                pip_command = [target.executable, "-m", "pip", "install"] + pip_arguments
+            if options.quiet:
+                pip_command += ["-q"]
+            if options.upgrade:
+                pip_command += ["--upgrade"]
+            if not self.resolve:
+                pip_command += ["--no-deps"]
+
+            logger.info(
+                "Installing with %s using command <subj>$ %s</subj>\n  %s",
+                "UV" if self.use_uv else "Pip",
+                " ".join(map(shlex.quote, pip_command)),
+                "\n  ".join(requirements),
+            )
+            if (res := sp.call(pip_command)) != 0:
+                return res
+        finally:
+            os.remove(fp.name)
 
         # Symlink all projects that need to be linked.
         for project_path in link_projects:
@@ -230,37 +324,13 @@ class PipInstaller(Installer):
           Exception: If an unexpected kind of dependency was encountered.
         """
 
-        from slap.python.dependency import GitDependency, PathDependency, PypiDependency, UrlDependency
+        builder = PipInstaller._PIP_ARG_BUILDERS.get(type(dependency))
+        if builder is None:
+            raise Exception(f"Unexpected dependency type: {dependency}")
 
         extras = "" if not dependency.extras else f'[{",".join(dependency.extras)}]'
-        hashes = " ".join(f"--hash={h}" for h in dependency.hashes or [])
-        pip_arguments = []
-
-        if isinstance(dependency, GitDependency):
-            # TODO (@NiklasRosenstein): Add Git branch/rev/tag to the URL.
-            if dependency.branch or dependency.rev or dependency.tag:
-                logger.warning(
-                    "PipInstaller does not currently support Git branch/rev/tag, dependency will be installed "
-                    "from main branch: <val>%s</val>",
-                    dependency,
-                )
-            pip_arguments += [f"{dependency.name}{extras} @ git+{dependency.url}"]
-
-        elif isinstance(dependency, PathDependency):
-            assert not dependency.link  # We caught that case before
-            if dependency.develop:
-                pip_arguments += ["-e"]
-            prefix = "" if dependency.path.is_absolute() else "./"
-            pip_arguments += [f"{prefix}{dependency.path}{extras}"]
-
-        elif isinstance(dependency, PypiDependency):
-            pip_arguments += [f"{dependency.name}{extras} {dependency.version.to_pep_508()} {hashes}".rstrip()]
-
-        elif isinstance(dependency, UrlDependency):
-            pip_arguments += [f"{dependency.name}{extras} @ {dependency.url} {hashes}".rstrip()]
-
-        else:
-            raise Exception(f"Unexpected dependency type: {dependency}")
+        hashes = " ".join(f"--hash={h}" for h in dependency.hashes) if dependency.hashes else ""
+        pip_arguments = builder(dependency, extras, hashes)
 
         assert pip_arguments, dependency
         return pip_arguments
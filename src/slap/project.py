@@ -5,7 +5,7 @@ import logging
 import typing as t
 from pathlib import Path
 
-from databind.core.settings import Alias
+from databind.core.settings import Alias, ExtraKeys
 
 from slap.configuration import Configuration
 
@@ -20,6 +20,36 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: The path to the user's Slap configuration file.
+USER_CONFIG_FILE = Path("~/.config/slap/config.toml").expanduser()
+
+
+class _LazyIndexes:
+    """Descriptor for #Dependencies.indexes that only creates an empty #Indexes object when it is accessed, as most
+    code paths that read dependencies never look at the indexes. This also avoids importing the installer module."""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = f"_{name}"
+
+    @t.overload
+    def __get__(self, instance: None, owner: type | None = None) -> None: ...
+
+    @t.overload
+    def __get__(self, instance: Dependencies, owner: type | None = None) -> Indexes: ...
+
+    def __get__(self, instance: Dependencies | None, owner: type | None = None) -> Indexes | None:
+        if instance is None:
+            return None  # The default value for the dataclass field.
+        value = instance.__dict__.get(self._attr)
+        if value is None:
+            from slap.install.installer import Indexes
+
+            value = instance.__dict__[self._attr] = Indexes()
+        return value
+
+    def __set__(self, instance: Dependencies, value: Indexes | None) -> None:
+        instance.__dict__[self._attr] = value
+
 
 @dataclasses.dataclass
 class Dependencies:
@@ -28,16 +58,10 @@ class Dependencies:
     dev: t.Sequence[Dependency]
     extra: t.Mapping[str, t.Sequence[Dependency]]
     build: t.Sequence[Dependency]
-    indexes: Indexes = None  # type: ignore  # To avoid having to import the Indexes class globally
-
-    def __post_init__(self) -> None:
-        from slap.install.installer import Indexes
-
-        if self.indexes is None:
-            self.indexes = Indexes()  # type: ignore[unreachable]
+    indexes: _LazyIndexes = _LazyIndexes()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Package:
     name: str  #: The name of the package. Contains periods in case of a namespace package.
     path: Path  #: The path to the package directory. This points to the namespace package if applicable.
@@ -45,6 +69,7 @@ class Package:
 
 
 @dataclasses.dataclass
+@ExtraKeys(True)
 class ProjectConfig:
     #: The name of the project handler plugin. If none is specified, the built-in project handlers are tested
     #: (see the #slap.ext.project_handlers module for more info on those).
@@ -90,7 +115,7 @@ class Project(Configuration):
         from slap.util.toml_file import TomlFile
 
         self.repository = repository
-        self.usercfg = TomlFile(Path("~/.config/slap/config.toml").expanduser())
+        self.usercfg = TomlFile(USER_CONFIG_FILE)
         self.handler = Once(self._get_project_handler)
         self.config = Once(self._get_project_configuration)
         self.packages = Once(self._get_packages)
@@ -102,10 +127,9 @@ class Project(Configuration):
     def _get_project_configuration(self) -> ProjectConfig:
         """Loads the project-level configuration."""
 
-        from databind.core.settings import ExtraKeys
         from databind.json import load
 
-        return load(self.raw_config(), ProjectConfig, settings=[ExtraKeys(True)])
+        return load(self.raw_config(), ProjectConfig)
 
     def _get_project_handler(self) -> ProjectHandlerPlugin:
         """Returns the handler for this project."""
@@ -133,19 +157,20 @@ class Project(Configuration):
 
         if not self.is_python_project:
             return []
-        packages = self.handler().get_packages(self)
+        handler = self.handler()
+        packages = handler.get_packages(self)
         if packages:
             logger.debug(
                 "Detected packages for project <subj>%s</subj> by package detector <obj>%s</obj>: <val>%s></val>",
                 self,
-                self.handler(),
+                handler,
                 packages,
             )
-        elif self.is_python_project and packages is not None:
+        elif packages is not None:
             logger.warning(
                 "No packages detected for project <subj>%s</subj> by any of package detectors <val>%s</val>",
                 self,
-                self.handler(),
+                handler,
             )
         return packages
 
@@ -168,17 +193,21 @@ class Project(Configuration):
         """Returns the dependencies of this project in the list of other projects. The returned dictionary maps
         to the project and the dependency constraint. This will only take run dependencies into account."""
 
-        dependency_names = set()
-        for dep in self.dependencies().run:
-            dependency_names.add(dep.name)
-
-        result = []
-        for project in projects:
-            if project.dist_name() in dependency_names:
-                result.append(project)
-                if recursive:
-                    result += project.get_interdependencies(projects, True)
-
+        by_name = {name: project for project in projects if (name := project.dist_name())}
+        result: list[Project] = []
+        visited = {self}
+
+        # NOTE: Projects are visited only once, which also protects against cycles in the dependency graph.
+        def visit(project: Project) -> None:
+            for dep in project.dependencies().run:
+                other = by_name.get(dep.name)
+                if other is not None and other not in visited:
+                    visited.add(other)
+                    result.append(other)
+                    if recursive:
+                        visit(other)
+
+        visit(self)
         return result
 
     def add_dependency(self, dependency: Dependency, where: str) -> None:
@@ -15,26 +15,40 @@ References:
 from __future__ import annotations
 
 import dataclasses
+import functools
 import re
 import typing as t
 from pathlib import Path
 from typing import TypeVar
-from urllib.parse import parse_qs, parse_qsl, urlparse, urlunparse
+from urllib.parse import parse_qs, parse_qsl, urlparse
 
 from typing_extensions import TypeAlias
 
 T = TypeVar("T")
 
+#: Matches the package name (and extras) at the start of a [PEP 508][] dependency string.
+_PACKAGE_NAME_REGEX = re.compile(r"\s*[^<>=!~\^\(\)\*]+")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_poetry_dependency(version_spec: str) -> t.Any:
+    """Parses *version_spec* into a Poetry dependency. The same version specs tend to appear many times across the
+    projects of a repository, so the result is cached. It must not be mutated."""
+
+    from poetry.core.packages.dependency import Dependency as _PoetryDependency  # type: ignore[import]
+
+    return _PoetryDependency("", version_spec)
+
 
 class VersionSpec:
     """Represents a version specification, which is either a [PEP 440][] version number, a [PEP 508][]
     dependency specification, or a [Poetry Dependencies][] specification string."""
 
     def __init__(self, version_spec: str) -> None:
-        from poetry.core.packages.dependency import Dependency as _PoetryDependency  # type: ignore[import]
-
         self.__original = version_spec.strip()
-        self.__dependency = _PoetryDependency("", self.__original)
+
+        # NOTE: An empty spec or `*` accepts any version. That is common enough to not involve Poetry for it.
+        self.__dependency = None if self.__original in ("", "*") else _parse_poetry_dependency(self.__original)
 
     def __bool__(self) -> bool:
         """Returns `True` if the version spec is initialized from an empty string. Note that it will otherwise
@@ -54,12 +68,17 @@ class VersionSpec:
         return False
 
     def to_pep_508(self) -> str:
+        if self.__dependency is None:
+            return ""
         # NOTE (@NiklasRosenstein): Removes parentheses around the spec.
         return self.__dependency.to_pep_508().strip()[1:-1]
 
     def accepts(self, version: str) -> bool:
         """Tests if the version spec accepts the given version string."""
 
+        if self.__dependency is None:
+            return True
+
         from poetry.core.constraints.version import Version  # type: ignore[import]
 
         return self.__dependency.constraint.allows(Version.parse(version))
@@ -156,9 +175,9 @@ class PypiDependency(Dependency, _PypiDependency):
     def parse(value: str) -> PypiDependency:
         """Parses a package name and its version spec from a string."""
 
-        value, markers = value.partition(";")[::2]
+        value, _, markers = value.partition(";")
 
-        match = re.match(r"\s*[^<>=!~\^\(\)\*]+", value)
+        match = _PACKAGE_NAME_REGEX.match(value)
         if match:
             name = match.group(0)
             constraint = value[match.end() :].strip() or "*"
@@ -178,7 +197,7 @@ class PypiDependency(Dependency, _PypiDependency):
     def parse_list(lst: t.Iterable[str]) -> list[PypiDependency]:
         """Parses a list of strings as #PypiDependency#s."""
 
-        return [PypiDependency.parse(x) for x in lst]
+        return list(map(PypiDependency.parse, lst))
 
 
 @dataclasses.dataclass
@@ -210,15 +229,49 @@ DependencyConfig: TypeAlias = "str | dict[str, t.Any] | list[dict[str, t.Any]]"
 def split_package_name_with_extras(value: str) -> tuple[str, list[str] | None]:
     """Splits *value* as a string that contains a package name and optionally its extras into components."""
 
-    match = re.match(r"\s*([^\[\]]+?)?\s*(?:\[([^\[\]]+)\])?\s*$", value)
-    if not match:
+    name, bracket, extras_string = value.strip().partition("[")
+    name = name.rstrip()
+    if "]" in name:
+        raise ValueError(f"invalid package name with extras: {value!r}")
+    if not bracket:
+        return name, None
+
+    extras_string, bracket, remainder = extras_string.partition("]")
+    if not bracket or remainder or "[" in extras_string:
         raise ValueError(f"invalid package name with extras: {value!r}")
 
-    extras = [x.strip() for x in match.group(2).split(",")] if match.group(2) else None
-    if extras is not None and not all(extras):
+    extras = [x.strip() for x in extras_string.split(",")]
+    if not all(extras):
         raise ValueError(f"invalid package name with extras: {value!r}")
 
-    return match.group(1), extras
+    return name, extras
+
+
+def split_options(value: str) -> tuple[str, dict[str, list[str]]]:
+    """Splits the Pip-style options (like `--hash=sha256:...`) off the end of a dependency string. Options start at
+    the first `--` that follows a whitespace, and the option value may be separated by `=` or whitespace.
+
+    Returns:
+      The dependency string without the options and a mapping of the option values by option name.
+    Raises:
+      ValueError: If something other than an option follows the first option.
+    """
+
+    start = -1
+    while (start := value.find("--", start + 1)) > 0 and not value[start - 1].isspace():
+        pass
+    if start <= 0:
+        return value, {}
+
+    options: dict[str, list[str]] = {}
+    tokens = iter(value[start:].split())
+    for token in tokens:
+        if not token.startswith("--"):
+            raise ValueError(f"unexpected {token!r} after options in dependency string: {value!r}")
+        name, sep, option_value = token[2:].partition("=")
+        options.setdefault(name, []).append(option_value if sep else next(tokens, ""))
+
+    return value[:start].rstrip(), options
 
 
 def parse_dependency_string(value: str) -> Dependency:
@@ -240,31 +293,26 @@ def parse_dependency_string(value: str) -> Dependency:
     """
 
     value = value.strip()
-    if value.startswith("http://") or value.startswith("https://") or value.startswith("git+"):
+    if value.startswith(("http://", "https://", "git+")):
         raise ValueError(f"A plain URL or Git repository URL must be prefixed with a package name: {value!r}")
 
-    # Extract trailing options from the dependency.
+    # Extract trailing options from the dependency. Most dependency strings have none.
     hashes: list[str] = []
-
-    def handle_option(match: re.Match) -> str:
-        if match.group(1) == "hash":
-            hashes.append(match.group(2))
-        return ""
-
-    value = re.sub(r"\s--(\w+)=(.*)(\s|$)", handle_option, value)
+    if "--" in value:
+        value, options = split_options(value)
+        hashes = options.get("hash", [])
 
     # Check if it's a dependency of the form `<name> @ <package>`. This can be either a
     # #UrlDependency or #GitDependency.
     if "@" in value:
         markers: str | None
-        name, url = value.partition("@")[::2]
+        name, _, url = value.partition("@")
         name, extras = split_package_name_with_extras(name)
-        url, markers = url.partition(";")[::2]
+        url, _, markers = url.partition(";")
         markers = markers.strip() or None
-        urlparts = urlparse(url.strip())
 
-        # Remove the fragments from the URL.
-        url = urlunparse((urlparts.scheme, urlparts.netloc, urlparts.path, urlparts.params, urlparts.query, None))
+        # Remove the fragment from the URL. It contains options for Git and path dependencies or hashes otherwise.
+        url, _, fragment = url.strip().partition("#")
 
         # Parse it as a Git URL.
         if url.startswith("git+"):
@@ -272,7 +320,7 @@ def parse_dependency_string(value: str) -> Dependency:
             def unpack(val: t.Sequence[T] | None) -> T | None:
                 return val[0] if val else None
 
-            options = parse_qs(urlparts.fragment)
+            options = parse_qs(fragment)
             return GitDependency(
                 name=name,
                 url=url[4:],
@@ -285,8 +333,8 @@ def parse_dependency_string(value: str) -> Dependency:
             )
 
         # Parse it as a path.
-        elif url.startswith("/") or url.startswith("./") or url.startswith("../"):
-            options = parse_qs(urlparts.fragment)
+        elif url.startswith(("/", "./", "../")):
+            options = parse_qs(fragment)
             return PathDependency(
                 name=name,
                 path=Path(url),
@@ -297,9 +345,9 @@ def parse_dependency_string(value: str) -> Dependency:
                 hashes=hashes or None,
             )
 
-        elif urlparts.scheme:
+        elif urlparse(url).scheme:
             # Treat all fragments as hash options.
-            hashes += [f"{item[0]}:{item[1]}" for item in parse_qsl(urlparts.fragment)]
+            hashes += [f"{item[0]}:{item[1]}" for item in parse_qsl(fragment)]
             return UrlDependency(
                 name=name,
                 url=url,
@@ -318,6 +366,24 @@ def parse_dependency_string(value: str) -> Dependency:
     return dependency
 
 
+#: Maps the key that identifies the kind of dependency in a dependency table to a function that creates the
+#: dependency from the table. If a table contains more than one of these keys, the first one in this mapping wins.
+_DEPENDENCY_CONFIG_PARSERS: dict[str, t.Callable[[str, dict[str, t.Any]], Dependency]] = {
+    "git": lambda name, dep: GitDependency(
+        name=name, url=dep["git"], rev=dep.get("rev"), branch=dep.get("branch"), tag=dep.get("tag")
+    ),
+    # NOTE (@NiklasRosenstein): The "link" key is actually not a Poetry feature, but it won't complain if
+    #   you are just using Slap anyway.
+    "path": lambda name, dep: PathDependency(
+        name=name, path=Path(dep["path"]), develop=dep.get("develop", False), link=dep.get("link", False)
+    ),
+    "url": lambda name, dep: UrlDependency(name=name, url=dep["url"]),
+    "version": lambda name, dep: PypiDependency(
+        name=name, version=VersionSpec(dep["version"]), source=dep.get("source")
+    ),
+}
+
+
 def _parse_single_dependency_config(name: str, dep: str | dict[str, t.Any]) -> Dependency:
     """Convert a single dependency expressed as a table or dictionary to a Slap dependency specification.
 
@@ -334,14 +400,7 @@ def _parse_single_dependency_config(name: str, dep: str | dict[str, t.Any]) -> D
         dep = dep.strip()
 
         # Check if the dependency specification appears to be in URL format.
-        if (
-            dep.startswith("git+")
-            or dep.startswith("http://")
-            or dep.startswith("https://")
-            or dep.startswith("../")
-            or dep.startswith("./")
-            or dep.startswith("/")
-        ):
+        if dep.startswith(("git+", "http://", "https://", "../", "./", "/")):
             dependency = parse_dependency_string(f"{name} @ {dep}")
         else:
             # If dep is _just_ a version number, we need to prefix it with a = to ensure the PypiDependency
@@ -351,33 +410,13 @@ def _parse_single_dependency_config(name: str, dep: str | dict[str, t.Any]) -> D
                 dep = f"={dep}"
             dependency = parse_dependency_string(f"{name} {dep}")
 
-    elif "git" in dep:
-        dependency = GitDependency(
-            name=name, url=dep["git"], rev=dep.get("rev"), branch=dep.get("branch"), tag=dep.get("tag")
-        )
-
-    elif "path" in dep:
-        # NOTE (@NiklasRosenstein): The "link" key is actually not a Poetry feature, but it won't complain if
-        #   you are just using Slap anyway.
-        dependency = PathDependency(
-            name=name, path=Path(dep["path"]), develop=dep.get("develop", False), link=dep.get("link", False)
-        )
-
-    elif "url" in dep:
-        dependency = UrlDependency(name=name, url=dep["url"])
-
-    elif "version" in dep:
-        dependency = PypiDependency(
-            name=name,
-            version=VersionSpec(dep["version"]),
-            source=dep.get("source"),
-        )
-
     else:
-        raise ValueError(f"Cannot interpret dependency: {name} = {dep!r}")
-
-    if not isinstance(dep, str):
-        dependency.python = VersionSpec(dep["python"]) if dep.get("python") else None
+        kind = next((key for key in _DEPENDENCY_CONFIG_PARSERS if key in dep), None)
+        if kind is None:
+            raise ValueError(f"Cannot interpret dependency: {name} = {dep!r}")
+        dependency = _DEPENDENCY_CONFIG_PARSERS[kind](name, dep)
+        python = dep.get("python")
+        dependency.python = VersionSpec(python) if python else None
         dependency.markers = dep.get("markers")
         dependency.extras = dep.get("extras")
 
@@ -408,7 +447,7 @@ def parse_dependencies(dependencies: list[str] | dict[str, DependencyConfig]) ->
     """
 
     if isinstance(dependencies, list):
-        return [parse_dependency_string(dep) for dep in dependencies]
+        return list(map(parse_dependency_string, dependencies))
 
     elif isinstance(dependencies, dict):
         return [parse_dependency_config(key, value) for key, value in dependencies.items()]
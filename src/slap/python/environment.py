@@ -4,15 +4,17 @@ import dataclasses
 import functools
 import json
 import logging
+import math
+import os
 import pickle
 import shutil
 import subprocess as sp
+import sys
 import textwrap
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from importlib_metadata import PathDistribution
-
 from slap.python import pep508
 
 if t.TYPE_CHECKING:
@@ -22,8 +24,89 @@ if t.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: The number of distributions above which #PythonEnvironment.get_distributions() splits the query across multiple
+#: subprocesses that run concurrently.
+GET_DISTRIBUTIONS_SHARD_THRESHOLD = 64
 
-@dataclasses.dataclass
+#: The script that #PythonEnvironment.has_importlib_metadata() runs in the Python environment.
+_HAS_IMPORTLIB_METADATA_SCRIPT = textwrap.dedent(
+    """
+    try: import importlib_metadata
+    except ImportError: print('false')
+    else: print('true')
+    """
+)
+
+#: The script that #PythonEnvironment.of() runs in the Python environment. It expects the directory of the
+#: #slap.python.pep508 module as its argument.
+_INTROSPECT_SCRIPT = textwrap.dedent(
+    """
+    import sys, platform, pickle
+    sys.path.append(sys.argv[1])
+    import pep508
+    try: import importlib_metadata as metadata
+    except ImportError: metadata = None
+    sys.stdout.buffer.write(pickle.dumps({
+        "executable": sys.executable,
+        "version": sys.version,
+        "version_tuple": tuple(sys.version_info[:3]),
+        "platform": platform.platform(),
+        "prefix": sys.prefix,
+        "base_prefix": getattr(sys, 'base_prefix', None),
+        "real_prefix": getattr(sys, 'real_prefix', None),
+        "pep508": pep508.Pep508Environment.current().as_json(),
+        "_has_pkg_resources": metadata is not None,
+    }))
+    """
+)
+
+#: The script that #PythonEnvironment.get_distributions() runs in the Python environment.
+_GET_DISTRIBUTIONS_SCRIPT = textwrap.dedent(
+    """
+    import sys, pickle
+    try: import importlib.metadata as metadata
+    except ImportError: import importlib_metadata as metadata
+    result = []
+    for arg in sys.argv[1:]:
+        try:
+            dist = metadata.distribution(arg)
+        except metadata.PackageNotFoundError:
+            dist = None
+        result.append(dist)
+    sys.stdout.buffer.write(pickle.dumps(result))
+    """
+)
+
+#: The script that #PythonEnvironment.get_distribution_metadata_bulk() runs in the Python environment.
+_GET_DISTRIBUTION_METADATA_SCRIPT = textwrap.dedent(
+    """
+    import sys, pickle
+    try: import importlib.metadata as metadata
+    except ImportError: import importlib_metadata as metadata
+    result = []
+    for arg in sys.argv[1:]:
+        try:
+            dist = metadata.distribution(arg)
+        except metadata.PackageNotFoundError:
+            result.append(None)
+            continue
+        meta = dist.metadata
+        path = getattr(dist, "_path", None)
+        result.append((
+            None if path is None else str(path),
+            meta["Version"],
+            meta.get("License"),
+            meta.get("Platform"),
+            meta.get("Requires-Python"),
+            meta.get_all("Requires-Dist") or [],
+            meta.get_all("Provides-Extra") or [],
+        ))
+    sys.stdout.buffer.write(pickle.dumps(result))
+    """
+)
+
+
+@dataclasses.dataclass(slots=True)
 class PythonEnvironment:
     """Represents a Python environment. Provides functionality to introspect the environment."""
 
@@ -46,20 +129,14 @@ class PythonEnvironment:
         """Checks if the Python environment has the `importlib_metadata` module available."""
 
         if self._has_pkg_resources is None:
-            code = textwrap.dedent(
-                """
-                try: import importlib_metadata
-                except ImportError: print('false')
-                else: print('true')
-                """
-            )
-            self._has_pkg_resources = json.loads(sp.check_output([self.executable, "-c", code]).decode())
+            output = sp.check_output([self.executable, "-c", _HAS_IMPORTLIB_METADATA_SCRIPT])
+            self._has_pkg_resources = json.loads(output.decode())
         return self._has_pkg_resources
 
     @staticmethod
-    @functools.lru_cache()
     def of(python: str | t.Sequence[str]) -> "PythonEnvironment":
-        """Introspects the given Python installation to construct a #PythonEnvironment."""
+        """Introspects the given Python installation to construct a #PythonEnvironment. The result is cached by the
+        resolved command, so e.g. `python` and its absolute path share the same result."""
 
         if isinstance(python, str):
             python = [python]
@@ -70,35 +147,14 @@ class PythonEnvironment:
         #
         #   A similar issue is described here: https://stackoverflow.com/q/65283987/791713
         full_path = shutil.which(python[0])
-        if full_path:
-            python = [full_path] + list(python[1:])
+        return PythonEnvironment._of((full_path or python[0], *python[1:]))
 
-        # We ensure that the Pep508 module is importable.
+    @staticmethod
+    @functools.lru_cache()
+    def _of(python: tuple[str, ...]) -> "PythonEnvironment":
+        # NOTE: The directory of the pep508 module is passed as an argument, so the script can import it.
         pep508_path = str(Path(pep508.__file__).parent)
-
-        code = textwrap.dedent(
-            f"""
-            import sys, platform, json, pickle
-            sys.path.append({pep508_path!r})
-            import pep508
-            try: import importlib_metadata as metadata
-            except ImportError: metadata = None
-            print(json.dumps({{
-                "executable": sys.executable,
-                "version": sys.version,
-                "version_tuple": sys.version_info[:3],
-                "platform": platform.platform(),
-                "prefix": sys.prefix,
-                "base_prefix": getattr(sys, 'base_prefix', None),
-                "real_prefix": getattr(sys, 'real_prefix', None),
-                "pep508": pep508.Pep508Environment.current().as_json(),
-                "_has_pkg_resources": metadata is not None,
-            }}))
-            """
-        )
-
-        payload = json.loads(sp.check_output(list(python) + ["-c", code]).decode())
-        payload["version_tuple"] = tuple(payload["version_tuple"])
+        payload = pickle.loads(sp.check_output([*python, "-c", _INTROSPECT_SCRIPT, pep508_path]))
         payload["pep508"] = pep508.Pep508Environment(**payload["pep508"])
         return PythonEnvironment(**payload)
 
@@ -109,30 +165,52 @@ class PythonEnvironment:
 
     def get_distributions(self, distributions: t.Collection[str]) -> dict[str, Distribution | None]:
         """Query the details for the given distributions in the Python environment with
-        #importlib_metadata.distribution()."""
-
-        code = textwrap.dedent(
-            """
-            import sys, pickle
-            try: import importlib.metadata as metadata
-            except ImportError: import importlib_metadata as metadata
-            result = []
-            for arg in sys.argv[1:]:
-                try:
-                    dist = metadata.distribution(arg)
-                except metadata.PackageNotFoundError:
-                    dist = None
-                result.append(dist)
-            sys.stdout.buffer.write(pickle.dumps(result))
-            """
-        )
+        #importlib_metadata.distribution(). If more than #GET_DISTRIBUTIONS_SHARD_THRESHOLD distributions are
+        queried, the query is split into up to one shard per CPU which are run in concurrent subprocesses."""
 
         keys = list(distributions)
-        result = pickle.loads(sp.check_output([self.executable, "-c", code] + keys))
-        return dict(zip(keys, result))
+        return dict(zip(keys, self._run_sharded(_GET_DISTRIBUTIONS_SCRIPT, keys)))
 
+    def get_distribution_metadata_bulk(
+        self, distributions: t.Collection[str]
+    ) -> dict[str, DistributionMetadata | None]:
+        """Like #get_distributions(), but returns the #DistributionMetadata of each distribution. The metadata is
+        read in the subprocess, so only plain values are sent back instead of the #Distribution objects."""
 
-@dataclasses.dataclass
+        keys = list(distributions)
+        result: dict[str, DistributionMetadata | None] = {}
+        for key, values in zip(keys, self._run_sharded(_GET_DISTRIBUTION_METADATA_SCRIPT, keys)):
+            if values is None:
+                result[key] = None
+                continue
+            location, version, license_name, platform, requires_python, requirements, extras = values
+            result[key] = DistributionMetadata(
+                location, version, license_name, platform, requires_python, requirements, set(extras)
+            )
+        return result
+
+    def _run_sharded(self, code: str, keys: list[str]) -> list[t.Any]:
+        """Runs the given *code* in the Python environment with the *keys* as arguments and returns the unpickled
+        list that it writes to stdout. If there are more than #GET_DISTRIBUTIONS_SHARD_THRESHOLD keys, they are
+        split into up to one shard per CPU which are run in concurrent subprocesses."""
+
+        if len(keys) <= GET_DISTRIBUTIONS_SHARD_THRESHOLD:
+            return self._run(code, keys)
+
+        num_shards = min(os.cpu_count() or 1, math.ceil(len(keys) / GET_DISTRIBUTIONS_SHARD_THRESHOLD))
+        shard_size = math.ceil(len(keys) / num_shards)
+        shards = [keys[i : i + shard_size] for i in range(0, len(keys), shard_size)]
+        result: list[t.Any] = []
+        with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+            for shard_result in executor.map(functools.partial(self._run, code), shards):
+                result += shard_result
+        return result
+
+    def _run(self, code: str, keys: list[str]) -> list[t.Any]:
+        return t.cast(list[t.Any], pickle.loads(sp.check_output([self.executable, "-c", code] + keys)))
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class DistributionMetadata:
     """Additional metadata for a distribution."""
 
@@ -145,20 +223,6 @@ class DistributionMetadata:
     extras: set[str]
 
 
-def get_distribution_metadata(dist: Distribution) -> DistributionMetadata:
-    """Parses the distribution metadata."""
-
-    return DistributionMetadata(
-        location=str(dist._path) if isinstance(dist, PathDistribution) else None,  # type: ignore[attr-defined]
-        version=dist.metadata["Version"],
-        license_name=dist.metadata.get("License"),
-        platform=dist.metadata.get("Platform"),
-        requires_python=dist.metadata.get("Requires-Python"),
-        requirements=dist.metadata.get_all("Requires-Dist") or [],
-        extras=set(dist.metadata.get_all("Provides-Extra") or []),
-    )
-
-
 @dataclasses.dataclass
 class DistributionGraph:
     """Represents a resolved graph of distributions, their metadata and dependencies in a Python environment."""
@@ -187,8 +251,8 @@ class DistributionGraph:
 def build_distribution_graph(
     env: PythonEnvironment,
     dependencies: list[Dependency],
-    resolved_callback: t.Callable[[dict[str, Distribution | None]], t.Any] | None = None,
-    dists_cache: dict[str, Distribution | None] | None = None,
+    resolved_callback: t.Callable[[dict[str, DistributionMetadata | None]], t.Any] | None = None,
+    dists_cache: dict[str, DistributionMetadata | None] | None = None,
 ) -> DistributionGraph:
     """Builds a #DistributionGraph in the given #PythonEnvironment using the given dependencies.
 
@@ -197,6 +261,8 @@ def build_distribution_graph(
       dependencies: The dependencies to resolve. Note that this list should already be filtered by its markers.
       resolved_callback: A callback that is invoked with the list of dependencies that have been successfully
         resolved. This is useful for progress reporting.
+      dists_cache: A cache for the metadata of distributions in the environment. It is filled with the metadata
+        of all distributions that are visited while building the graph.
     """
 
     from slap.python.dependency import parse_dependencies
@@ -209,57 +275,46 @@ def build_distribution_graph(
 
     logger.info("Fetching requirements: <val>%s</val>", dependencies)
 
-    # TODO (@NiklasRosenstein): Should we warn here if the dependencies map is smaller than the dependencies list?
-    dependencies_map = {dependency.name: dependency for dependency in dependencies}
-
-    # Resolve the distributions available in the Python environment.
-    distributions = {dist_name: dists_cache[dist_name] for dist_name in dependencies_map if dist_name in dists_cache}
-    fetch_distributions = dependencies_map.keys() - distributions.keys()
-    if fetch_distributions:
-        fetched_distributions = env.get_distributions(fetch_distributions)
-        distributions.update(fetched_distributions)
-        dists_cache.update(fetched_distributions)
-
-    if resolved_callback:
-        resolved_callback(distributions)
-
-    # Parse the dependencies of the distributions.
-    prefetch_distributions: set[str] = set()
-    metadata: dict[str, tuple[DistributionMetadata, list[Dependency]]] = {}
-    for dist_name, dist in distributions.items():
-        if dist is None:
-            graph.missing.add(dist_name)
-        else:
-            dist_meta = get_distribution_metadata(dist)
-            dist_extras = set(dependencies_map[dist_name].extras or [])
-            parsed_dependencies = filter_dependencies(
-                parse_dependencies(dist_meta.requirements), env.pep508, dist_extras
-            )
-            metadata[dist_name] = (dist_meta, parsed_dependencies)
-            prefetch_distributions |= {dependency.name for dependency in parsed_dependencies}
-
-    # Prefetch distributions.
-    prefetch_distributions -= dists_cache.keys()
-    if prefetch_distributions:
-        dists_cache.update(env.get_distributions(prefetch_distributions))
-
-    # Continue building the graph recursively.
-    for dist_name, (dist_meta, parsed_dependencies) in metadata.items():
-        graph.metadata[dist_name] = dist_meta
-
-        for dependency in parsed_dependencies:
-            graph.dependencies.setdefault(dist_name, set()).add(dependency.name)
-
-        # TODO (@NiklasRosenstein): Potential optimization here is to cache which distributions have already been
-        #   resolved; and to pre-fetch all distributions needed in the recursive call in the parent collectively
-        #   across all the dependencies of the current set of distributions.
-        new_graph = build_distribution_graph(
-            env=env,
-            dependencies=parsed_dependencies,
-            resolved_callback=resolved_callback,
-            dists_cache=dists_cache,
-        )
-
-        graph.update(new_graph)
+    # NOTE: The graph is built breadth-first, so the distributions of an entire level can be fetched with a single
+    #   subprocess. A distribution is only revisited if it is required with extras that were not seen before.
+    resolved_extras: dict[str, set[str]] = {}
+    requirements: dict[str, list[Dependency]] = {}
+    frontier: list[Dependency] = list(dependencies)
+    while frontier:
+        # NOTE: The same names are parsed from the requirements of many distributions. We intern them, so the
+        #   graph only holds a single copy of each name and lookups can compare by identity.
+        pending: dict[str, set[str]] = {}
+        for dependency in frontier:
+            name = sys.intern(dependency.name)
+            extras = set(dependency.extras or [])
+            if name not in resolved_extras or not extras <= resolved_extras[name]:
+                pending.setdefault(name, set()).update(extras)
+
+        # Resolve the distributions available in the Python environment.
+        fetch_distributions = pending.keys() - dists_cache.keys()
+        if fetch_distributions:
+            dists_cache.update(env.get_distribution_metadata_bulk(fetch_distributions))
+        distributions = {dist_name: dists_cache[dist_name] for dist_name in pending}
+
+        if resolved_callback and distributions:
+            resolved_callback(distributions)
+
+        # Parse the dependencies of the distributions, they make up the next level of the graph.
+        frontier = []
+        for dist_name, dist_meta in distributions.items():
+            dist_extras = resolved_extras.setdefault(dist_name, set())
+            dist_extras |= pending[dist_name]
+            if dist_meta is None:
+                graph.missing.add(dist_name)
+                continue
+
+            # NOTE: The requirements are only parsed once, even if the distribution is revisited with new extras.
+            if dist_name not in requirements:
+                graph.metadata[dist_name] = dist_meta
+                requirements[dist_name] = parse_dependencies(dist_meta.requirements)
+            parsed_dependencies = filter_dependencies(requirements[dist_name], env.pep508, dist_extras)
+            for dependency in parsed_dependencies:
+                graph.dependencies.setdefault(dist_name, set()).add(sys.intern(dependency.name))
+            frontier += parsed_dependencies
 
     return graph
@@ -13,6 +13,22 @@ if t.TYPE_CHECKING:
 class Pep508Environment:
     """Contains the variables for evaluating PEP 508 environment markers."""
 
+    # NOTE: This class is also imported by older Python versions in #PythonEnvironment.of(), which is why it does
+    #   not use `@dataclasses.dataclass(slots=True)`.
+    __slots__ = (
+        "python_version",
+        "python_full_version",
+        "os_name",
+        "sys_platform",
+        "platform_release",
+        "platform_system",
+        "platform_machine",
+        "platform_python_implementation",
+        "implementation_name",
+        "implementation_version",
+        "_markers_cache",
+    )
+
     def __init__(
         self,
         python_version: str,
@@ -36,6 +52,7 @@ class Pep508Environment:
         self.platform_python_implementation = platform_python_implementation
         self.implementation_name = implementation_name
         self.implementation_version = implementation_version
+        self._markers_cache: t.Dict[t.Tuple[str, t.Optional[t.FrozenSet[str]]], bool] = {}
 
     def __repr__(self) -> str:
         args = ", ".join([f"{k}={v!r}" for k, v in self.as_json().items()])
@@ -71,7 +88,7 @@ class Pep508Environment:
         )
 
     def as_json(self) -> t.Dict[str, str]:
-        return dict(vars(self))
+        return {k: getattr(self, k) for k in self.__slots__ if not k.startswith("_")}
 
     def evaluate_markers(
         self, markers: str, extras: t.Optional[t.Set[str]] = None, source: t.Optional[str] = None
@@ -86,72 +103,104 @@ class Pep508Environment:
             is invalid, this value will be included in the error message. If not specified, falls back to `<string>`.
         """
 
+        # NOTE: The same few markers are evaluated over and over again, e.g. while building a distribution graph.
+        cache_key = (markers, None if extras is None else frozenset(extras))
+        result = self._markers_cache.get(cache_key)
+        if result is not None:
+            return result
+
         scope = self.as_json()
 
         if extras is not None:
-
-            class ExtrasEq:
-                def __repr__(self) -> str:
-                    return f"ExtrasEq({extras!r})"
-
-                def __eq__(self, other) -> bool:
-                    if isinstance(other, str):
-                        assert extras is not None
-                        return other in extras
-                    return False
-
-            scope["extra"] = t.cast(str, ExtrasEq())
+            scope["extra"] = t.cast(str, _ExtrasEq(extras))
 
         try:
-            return _eval_environment_marker_ast(ast.parse(markers, filename=source or "<string>", mode="eval"), scope)
+            result = bool(_compile_markers(markers, source or "<string>")(scope))
         except (ValueError, KeyError) as exc:
             raise ValueError(f"invalid environment marker string: {markers!r}\n  hint: {exc}")
 
+        self._markers_cache[cache_key] = result
+        return result
+
+
+class _ExtrasEq:
+    """The value of the `extra` marker. It compares equal to each of the extras it was created with."""
+
+    __slots__ = ("_extras",)
+
+    def __init__(self, extras: t.Set[str]) -> None:
+        self._extras = extras
+
+    def __repr__(self) -> str:
+        return f"ExtrasEq({self._extras!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, str) and other in self._extras
 
-def _eval_environment_marker_ast(node: ast.AST, scope: t.Dict[str, t.Any]) -> bool:
-    """Evaluates an environment marker AST using the given *scope*. This is safer than using #eval()
-    to avoid arbitrary code execution."""
+
+#: A compiled environment marker expression that evaluates the expression against a scope.
+_CompiledMarkers = t.Callable[[t.Dict[str, t.Any]], t.Any]
+
+#: The comparison operators that are supported in environment markers.
+_COMPARE_OPERATORS: t.Dict[t.Type[ast.cmpop], t.Callable[[t.Any, t.Any], t.Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_markers(markers: str, filename: str) -> _CompiledMarkers:
+    """Parses and compiles an environment marker expression. The result is cached because the same handful of
+    markers are usually evaluated for many dependencies."""
+
+    return _compile_environment_marker_ast(ast.parse(markers, filename=filename, mode="eval"))
+
+
+def _compile_environment_marker_ast(node: ast.AST) -> _CompiledMarkers:
+    """Compiles an environment marker AST into a function that evaluates it against a scope. The AST is only walked
+    once, instead of on every evaluation. This is safer than using #eval() to avoid arbitrary code execution."""
 
     if isinstance(node, ast.Expression):
-        return _eval_environment_marker_ast(node.body, scope)
+        return _compile_environment_marker_ast(node.body)
 
     if isinstance(node, ast.BoolOp):
-        op, initial = {
-            ast.And: (operator.and_, True),
-            ast.Or: (operator.or_, False),
-        }[type(node.op)]
-        return functools.reduce(lambda a, b: op(a, _eval_environment_marker_ast(b, scope)), node.values, initial)
+        values = [_compile_environment_marker_ast(value) for value in node.values]
+        if isinstance(node.op, ast.And):
+            return lambda scope: all(value(scope) for value in values)
+        return lambda scope: any(value(scope) for value in values)
 
     elif isinstance(node, ast.Compare):
         if len(node.ops) != 1 or len(node.comparators) != 1:
             raise ValueError("multiple comparators are not supported in environment markers")
-        op = {
-            ast.Eq: operator.eq,
-            ast.NotEq: operator.ne,
-            ast.Lt: operator.lt,
-            ast.LtE: operator.le,
-            ast.Gt: operator.gt,
-            ast.GtE: operator.ge,
-        }[type(node.ops[0])]
-        return op(
-            _eval_environment_markers_ast_value(node.left, scope),
-            _eval_environment_markers_ast_value(node.comparators[0], scope),
-        )
+        op = _COMPARE_OPERATORS[type(node.ops[0])]
+        left = _compile_environment_markers_ast_value(node.left)
+        right = _compile_environment_markers_ast_value(node.comparators[0])
+        return lambda scope: op(left(scope), right(scope))
 
     raise ValueError(f"Node of type {type(node).__name__!r} not supported in environment markers")
 
 
-def _eval_environment_markers_ast_value(node: ast.expr, scope: t.Dict[str, t.Any]) -> t.Any:
-    """Resolve the value of an AST expression from the given *scope*."""
+def _compile_environment_markers_ast_value(node: ast.expr) -> _CompiledMarkers:
+    """Compiles an AST expression into a function that resolves its value from a scope."""
 
     if isinstance(node, ast.Name):
-        try:
-            return scope[node.id]
-        except KeyError:
-            raise ValueError(f"Marker {node.id!r} is not available in this context")
+        name = node.id
+
+        def lookup(scope: t.Dict[str, t.Any]) -> t.Any:
+            try:
+                return scope[name]
+            except KeyError:
+                raise ValueError(f"Marker {name!r} is not available in this context")
+
+        return lookup
 
     elif isinstance(node, ast.Constant):
-        return node.value
+        value = node.value
+        return lambda scope: value
 
     raise ValueError(f"Node of type {type(node).__name__!r} not supported in environment markers")
 
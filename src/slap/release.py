@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import functools
 import re
 import typing as t
 from pathlib import Path
@@ -10,6 +11,14 @@ from slap.util.notset import NotSet
 T = t.TypeVar("T")
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compiles a version reference pattern with the #re.M and #re.S flags. The same few patterns are matched
+    against many files during a release."""
+
+    return re.compile(pattern, re.M | re.S)
+
+
 @t.overload
 def match_version_ref_pattern(filename: Path, pattern: str) -> VersionRef: ...
 
@@ -28,7 +37,7 @@ def match_version_ref_pattern(filename: Path, pattern: str, fallback: NotSet | T
       pattern: The regular expression that contains at least one capturing group.
     """
 
-    compiled_pattern = re.compile(pattern, re.M | re.S)
+    compiled_pattern = _compile_pattern(pattern)
     if not compiled_pattern.groups:
         raise ValueError(
             f"pattern must contain at least one capturing group (filename: {filename!r}, pattern: {pattern!r})"
@@ -48,9 +57,9 @@ def match_version_ref_pattern_on_lines(filename: Path, pattern: str) -> list[Ver
     """Like #match_version_ref_pattern(), but returns all matches, but matches it on a line-by-line basis. The
     *pattern* must have a `version` group. The pattern is compiled with #re.M and #re.S flags."""
 
-    compiled_pattern = re.compile(pattern, re.M | re.S)
+    compiled_pattern = _compile_pattern(pattern)
     refs = []
-    for match in re.finditer(compiled_pattern, filename.read_text()):
+    for match in compiled_pattern.finditer(filename.read_text()):
         refs.append(
             VersionRef(
                 file=filename,
@@ -63,7 +72,7 @@ def match_version_ref_pattern_on_lines(filename: Path, pattern: str) -> list[Ver
     return refs
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class VersionRef:
     """Represents a reference to a version number in a file."""
 
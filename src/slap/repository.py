@@ -16,7 +16,7 @@ if t.TYPE_CHECKING:
     from slap.util.vcs import Vcs
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Issue:
     """Represents an issue."""
 
@@ -25,7 +25,7 @@ class Issue:
     shortform: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class PullRequest:
     """Represents a pull request."""
 
@@ -78,6 +78,8 @@ class Repository(Configuration):
         super().__init__(directory)
         self._handler = Once(self._get_repository_handler)
         self.projects = Once(self._get_projects)
+        self._projects_ordered = Once(self._get_projects_ordered)
+        self._projects_by_directory = Once(self._get_projects_by_directory)
         self.vcs = Once(self._get_vcs)
         self.host = Once(self._get_repository_host)
 
@@ -130,6 +132,9 @@ class Repository(Configuration):
     def get_projects_ordered(self) -> list[Project]:
         """Return a topological ordering of the projects."""
 
+        return list(self._projects_ordered())
+
+    def _get_projects_ordered(self) -> list[Project]:
         from slap.project import Project
         from slap.util.digraph import DiGraph, topological_sort
 
@@ -138,9 +143,15 @@ class Repository(Configuration):
         for project in projects:
             assert isinstance(project, Project)
             graph.add_node(project, None)
-            for dep in project.get_interdependencies(projects):
-                graph.add_node(dep, None)
-                graph.add_edge(dep, project, None)
+
+        # NOTE: This is equivalent to #Project.get_interdependencies() for every project, but the index of the
+        #   projects by their distribution name is only built once.
+        by_name = {name: project for project in projects if (name := project.dist_name())}
+        for project in projects:
+            for dep in project.dependencies().run:
+                other = by_name.get(dep.name)
+                if other is not None and other is not project:
+                    graph.add_edge(other, project, None)
 
         return list(topological_sort(graph, sorting_key=lambda p: p.id))
 
@@ -154,8 +165,11 @@ class Repository(Configuration):
 
         return Optional(self._handler()).map(lambda h: h.get_repository_host(self)).or_else(None)
 
+    def _get_projects_by_directory(self) -> dict[Path, Project]:
+        return {project.directory: project for project in self.projects()}
+
     def get_project_by_directory(self, directory: Path) -> Project:
-        for project in self.projects():
-            if project.directory == directory:
-                return project
-        raise ValueError(f"no project found for directory {directory}")
+        try:
+            return self._projects_by_directory()[directory]
+        except KeyError:
+            raise ValueError(f"no project found for directory {directory}")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import collections
 import dataclasses
+import heapq
+import itertools
 import typing as t
-import weakref
 
 from typing_extensions import Protocol
 
@@ -30,8 +32,6 @@ class DiGraph(t.Generic[K, N, E]):
         self._roots: dict[K, None] = {}
         self._leafs: dict[K, None] = {}
         self._edges: dict[tuple[K, K], E] = {}
-        self._nodesview = NodesView(self)
-        self._edgesview = EdgesView(self)
 
     def add_node(self, node_id: K, value: N) -> None:
         """
@@ -69,7 +69,7 @@ class DiGraph(t.Generic[K, N, E]):
         Returns a view on the nodes in the graph.
         """
 
-        return self._nodesview
+        return NodesView(self)
 
     @property
     def edges(self) -> "EdgesView[K, E]":
@@ -77,7 +77,7 @@ class DiGraph(t.Generic[K, N, E]):
         Returns a view on the edges in the graph.
         """
 
-        return self._edgesview
+        return EdgesView(self)
 
     @property
     def roots(self) -> t.KeysView[K]:
@@ -132,6 +132,29 @@ class DiGraph(t.Generic[K, N, E]):
         except KeyError:
             raise UnknownNodeError(node_id)
 
+    def _remove_edge(self, node_id1: K, node_id2: K) -> None:
+        try:
+            del self._edges[(node_id1, node_id2)]
+        except KeyError:
+            raise UnknownEdgeError((node_id1, node_id2))
+        node1, node2 = self._nodes[node_id1], self._nodes[node_id2]
+        del node1.successors[node_id2]
+        del node2.predecessors[node_id1]
+        if not node1.successors:
+            self._leafs[node_id1] = None
+        if not node2.predecessors:
+            self._roots[node_id2] = None
+
+    def _remove_node(self, node_id: K) -> None:
+        node = self._get_node(node_id)
+        for pred in list(node.predecessors):
+            self._remove_edge(pred, node_id)
+        for succ in list(node.successors):
+            self._remove_edge(node_id, succ)
+        del self._nodes[node_id]
+        self._roots.pop(node_id, None)
+        self._leafs.pop(node_id, None)
+
 
 @dataclasses.dataclass
 class _Node(t.Generic[K, N]):
@@ -142,7 +165,7 @@ class _Node(t.Generic[K, N]):
 
 class NodesView(t.Mapping[K, N]):
     def __init__(self, g: DiGraph[K, N, t.Any]) -> None:
-        self._g = weakref.ref(g)
+        self._g = g
         self._nodes = g._nodes
 
     def __repr__(self) -> str:
@@ -164,27 +187,15 @@ class NodesView(t.Mapping[K, N]):
             raise UnknownNodeError(key)
 
     def __setitem__(self, key: K, value: N) -> None:
-        g = self._g()
-        assert g is not None
-        g.add_node(key, value)
+        self._g.add_node(key, value)
 
     def __delitem__(self, key: K) -> None:
-        g = self._g()
-        assert g is not None
-        node = g._nodes.pop(key)
-        for pred in node.predecessors:
-            g._nodes[pred].successors.pop(key)
-            del g._edges[(pred, key)]
-        for succ in node.successors:
-            g._nodes[succ].predecessors.pop(key)
-            del g._edges[(key, succ)]
-        g._roots.pop(key, None)
-        g._leafs.pop(key, None)
+        self._g._remove_node(key)
 
 
 class EdgesView(t.Mapping["tuple[K, K]", E]):
     def __init__(self, g: DiGraph[K, t.Any, E]) -> None:
-        self._g = weakref.ref(g)
+        self._g = g
         self._edges = g._edges
 
     def __repr__(self) -> str:
@@ -206,12 +217,10 @@ class EdgesView(t.Mapping["tuple[K, K]", E]):
             raise UnknownEdgeError(key)
 
     def __setitem__(self, key: tuple[K, K], value: E) -> None:
-        g = self._g()
-        assert g is not None
-        g.add_edge(key[0], key[1], value)
+        self._g.add_edge(key[0], key[1], value)
 
     def __delitem__(self, key: tuple[K, K]) -> None:
-        del self._edges[key]
+        self._g._remove_edge(key[0], key[1])
 
 
 class UnknownNodeError(KeyError):
@@ -232,24 +241,38 @@ class Comparable(Protocol):
 def topological_sort(
     graph: DiGraph[K, N, E], sorting_key: t.Optional[t.Callable[[K], Comparable]] = None
 ) -> t.Iterator[K]:
-    """Calculate the topological order for elements in the *graph*.
+    """Calculate the topological order for elements in the *graph*. If a *sorting_key* is specified, nodes that
+    are ready to be emitted at the same time are yielded in the order of that key.
 
     @raises RuntimeError: If there is a cycle in the graph."""
 
-    seen: set[K] = set()
-    roots = graph.roots
-
-    while roots:
-        if seen & roots:
-            raise RuntimeError(f"encountered a cycle in the graph at {seen & roots}")
-        seen.update(roots)
-        yield from roots
-        roots = {
-            k: None
-            for n in roots
-            for k in sorted(graph.successors(n), key=sorting_key)  # type: ignore
-            if not graph.predecessors(k) - seen
-        }.keys()
-
-    if len(seen) != len(graph.nodes):
-        raise RuntimeError(f"encountered a cycle in the graph (unreached nodes {set(graph.nodes) - seen})")
+    in_degree = {node_id: len(node.predecessors) for node_id, node in graph._nodes.items()}
+    queue: collections.deque[K] = collections.deque()
+    heap: list[tuple[Comparable, int, K]] = []
+    counter = itertools.count()  # NOTE: Breaks ties in the heap without comparing the node IDs themselves.
+
+    def push(node_id: K) -> None:
+        if sorting_key is None:
+            queue.append(node_id)
+        else:
+            heapq.heappush(heap, (sorting_key(node_id), next(counter), node_id))
+
+    def pop() -> K:
+        return queue.popleft() if sorting_key is None else heapq.heappop(heap)[2]
+
+    for node_id in graph.roots:
+        push(node_id)
+
+    emitted = 0
+    while queue or heap:
+        node_id = pop()
+        emitted += 1
+        yield node_id
+        for succ in graph._nodes[node_id].successors:
+            in_degree[succ] -= 1
+            if in_degree[succ] == 0:
+                push(succ)
+
+    if emitted != len(graph._nodes):
+        unreached = {node_id for node_id, degree in in_degree.items() if degree > 0}
+        raise RuntimeError(f"encountered a cycle in the graph (unreached nodes {unreached})")
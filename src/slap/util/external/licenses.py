@@ -7,6 +7,7 @@ Scraper for [SPDX][1].
 from __future__ import annotations
 
 import dataclasses
+import textwrap
 import typing as t
 
 import requests
@@ -53,25 +54,18 @@ class SpdxLicenseDetails:
 
 
 def wrap_license_text(license_text: str, width: int = 79) -> str:
-    lines = []
+    """Wraps lines in *license_text* that are longer than *width*. Blank lines and indentation are preserved."""
+
+    wrapper = textwrap.TextWrapper(
+        width=width,
+        expand_tabs=False,
+        replace_whitespace=False,
+        break_long_words=False,
+        break_on_hyphens=False,
+    )
+    lines: list[str] = []
     for raw_line in license_text.split("\n"):
-        line = raw_line.split(" ")
-        length = sum(map(len, line)) + len(line) - 1
-        if length > width:
-            words: list[str] = []
-            length = -1
-            for word in line:
-                if length + 1 + len(word) >= width:
-                    lines.append(" ".join(words))
-                    words = []
-                    length = -1
-                else:
-                    words.append(word)
-                    length += len(word) + 1
-            if words:
-                lines.append(" ".join(words))
-        else:
-            lines.append(" ".join(line))
+        lines.extend(wrapper.wrap(raw_line) or [""])
     return "\n".join(lines)
 
 
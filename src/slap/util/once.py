@@ -6,6 +6,9 @@ from .supplier import Supplier, T_co
 
 
 class Once(t.Generic[T_co]):
+    # NOTE: Every #Project and #Repository holds a handful of these, so we avoid the per-instance `__dict__`.
+    __slots__ = ("_supplier", "_cached", "_value")
+
     def __init__(self, supplier: Supplier[T_co]) -> None:
         self._supplier = supplier
         self._cached: bool = False
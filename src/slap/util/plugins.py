@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import typing as t
 
@@ -20,6 +21,14 @@ class NoSuchEntrypointError(RuntimeError):
     pass
 
 
+@functools.lru_cache(maxsize=None)
+def _get_entrypoints(group_name: str) -> tuple[importlib_metadata.EntryPoint, ...]:
+    """Returns the entrypoints in the given group. Looking them up requires scanning the metadata of all installed
+    distributions, so the result is cached as the installed distributions do not change while Slap is running."""
+
+    return tuple(importlib_metadata.entry_points(group=group_name))
+
+
 @t.overload
 def load_entrypoint(group: str, name: str) -> t.Any: ...
 
@@ -36,9 +45,10 @@ def load_entrypoint(group: str | type[T], name: str) -> t.Any | type[T]:
     else:
         group_name = group
 
-    for ep in importlib_metadata.entry_points(group=group_name, name=name):
-        value = ep.load()
-        break
+    for ep in _get_entrypoints(group_name):
+        if ep.name == name:
+            value = ep.load()
+            break
     else:
         raise NoSuchEntrypointError(f'no entrypoint "{name}" in group "{group}"')
 
@@ -85,7 +95,7 @@ def iter_entrypoints(group: str | type[T]) -> _Iter_Entrypoints_1 | _Iter_Entryp
 
         return loader
 
-    for ep in importlib_metadata.entry_points(group=group_name):
+    for ep in _get_entrypoints(group_name):
         if isinstance(group, type):
             yield ep.name, _make_loader(ep)
         else:
@@ -169,7 +169,7 @@ def parse_color(color_string: str) -> Color:
 
     else:
         color_string = color_string.upper()
-        bright = color_string.startswith("BRIGHT_") or color_string.startswith("BRIGHT ")
+        bright = color_string.startswith(("BRIGHT_", "BRIGHT "))
         if bright:
             color_string = color_string[7:]
         if hasattr(SgrColorName, color_string):
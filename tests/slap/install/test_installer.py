@@ -0,0 +1,9 @@
+from slap.install.installer import _dependency_key
+from slap.python.dependency import parse_dependency_string
+
+
+def test__dependency_key__ignores_order_of_extras_and_hashes() -> None:
+    key = _dependency_key(parse_dependency_string("kek[a,b] ^1.0.0 --hash=sha256:x --hash=sha256:y"))
+    assert key == _dependency_key(parse_dependency_string("kek[b,a] ^1.0.0 --hash=sha256:y --hash=sha256:x"))
+    assert key != _dependency_key(parse_dependency_string("kek[a,b] ^2.0.0 --hash=sha256:x --hash=sha256:y"))
+    assert key != _dependency_key(parse_dependency_string("kek[a,b] ^1.0.0; os_name == 'nt'"))
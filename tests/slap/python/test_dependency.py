@@ -11,6 +11,7 @@ from slap.python.dependency import (
     VersionSpec,
     parse_dependency_config,
     parse_dependency_string,
+    split_options,
     split_package_name_with_extras,
 )
 
@@ -33,6 +34,14 @@ def test__split_package_name_with_extras__bad_input():
         split_package_name_with_extras("kek][docs]")
 
 
+def test__split_options():
+    assert split_options("kek ^1.0.0") == ("kek ^1.0.0", {})
+    assert split_options("kek --hash=sha1:1 --hash=sha1:2") == ("kek", {"hash": ["sha1:1", "sha1:2"]})
+    assert split_options("kek; os_name=='a--b'  --hash sha1:1") == ("kek; os_name=='a--b'", {"hash": ["sha1:1"]})
+    with pytest.raises(ValueError):
+        split_options("kek --hash=sha1:1 ; python_version < '3'")
+
+
 def test__parse_dependency_string__can_parse_pypi_dependency():
     assert parse_dependency_string("kek") == PypiDependency("kek", VersionSpec("*"))
     assert parse_dependency_string("kek *") == PypiDependency("kek", VersionSpec("*"))
@@ -52,6 +61,19 @@ def test__parse_dependency_string__can_parse_pypi_dependency():
     )
 
 
+def test__parse_dependency_string__returns_a_new_object_every_time():
+    dependency = parse_dependency_string("kek ^1.0.0")
+    dependency.markers = "os_name == 'nt'"
+    assert parse_dependency_string("kek ^1.0.0") == PypiDependency("kek", VersionSpec("^1.0.0"))
+    dependency = parse_dependency_string("kek[a] ^1.0.0 --hash=sha256:x")
+    assert dependency.extras is not None and dependency.hashes is not None
+    dependency.extras.append("b")
+    dependency.hashes.append("y")
+    assert parse_dependency_string("kek[a] ^1.0.0 --hash=sha256:x") == PypiDependency(
+        "kek", VersionSpec("^1.0.0"), extras=["a"], hashes=["sha256:x"]
+    )
+
+
 def test__parse_dependency_string__can_parse_git_dependency():
     assert parse_dependency_string('kek@git+https://github.com/kek/kek.git; os_name="nt"') == GitDependency(
         "kek", "https://github.com/kek/kek.git", markers='os_name="nt"'
@@ -119,8 +141,10 @@ def test__parse_dependency_config__various_configurations():
 
 
 def test__VersionSpec__can_take_empty_string():
-    assert VersionSpec("*").to_pep_508() == ""
-    assert not VersionSpec("*")
+    assert VersionSpec("").to_pep_508() == ""
+    assert not VersionSpec("")
+    assert VersionSpec("").accepts("1.0.0")
+    assert VersionSpec("") == VersionSpec("*")
 
 
 def test__VersionSpec__can_take_wildcard():
@@ -1,7 +1,11 @@
 import platform
 import sys
 
-from slap.python.environment import PythonEnvironment
+import pytest
+
+from slap.python import environment as environment_module
+from slap.python.dependency import parse_dependencies
+from slap.python.environment import PythonEnvironment, build_distribution_graph
 
 
 def test__PythonEnvironment__with_current_python_instance():
@@ -14,3 +18,34 @@ def test__PythonEnvironment__with_current_python_instance():
     assert environment.real_prefix == getattr(sys, "real_prefix", None)
     assert environment.has_importlib_metadata()
     assert environment.get_distribution("setuptools") is not None
+
+
+def test__PythonEnvironment__of__caches_by_resolved_command():
+    assert PythonEnvironment.of(sys.executable) is PythonEnvironment.of([sys.executable])
+    assert PythonEnvironment.of(sys.executable) is PythonEnvironment.of((sys.executable,))
+
+
+def test__build_distribution_graph__resolves_transitive_dependencies():
+    environment = PythonEnvironment.of(sys.executable)
+    graph = build_distribution_graph(environment, parse_dependencies(["pytest", "pytest"]))
+    assert "pluggy" in graph.dependencies["pytest"]
+    assert "pluggy" in graph.metadata
+    assert not graph.missing
+
+
+def test__PythonEnvironment__get_distributions__shards_large_queries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(environment_module, "GET_DISTRIBUTIONS_SHARD_THRESHOLD", 1)
+    environment = PythonEnvironment.of(sys.executable)
+    distributions = environment.get_distributions(["pytest", "not-a-dist", "pluggy"])
+    assert list(distributions) == ["pytest", "not-a-dist", "pluggy"]
+    assert distributions["pytest"] is not None and distributions["pluggy"] is not None
+    assert distributions["not-a-dist"] is None
+
+
+def test__PythonEnvironment__get_distribution_metadata_bulk():
+    environment = PythonEnvironment.of(sys.executable)
+    metadata = environment.get_distribution_metadata_bulk(["pytest", "not-a-dist"])
+    assert metadata["not-a-dist"] is None
+    assert metadata["pytest"] is not None
+    assert metadata["pytest"].location and metadata["pytest"].location.endswith(".dist-info")
+    assert any(requirement.startswith("pluggy") for requirement in metadata["pytest"].requirements)
@@ -1,4 +1,4 @@
-from slap.python.pep508 import Pep508Environment
+from slap.python.pep508 import Pep508Environment, _compile_markers
 
 
 def test__Pep508Environment__sample_markers():
@@ -38,3 +38,16 @@ def test__Pep508Environment__sample_markers():
     # All fields are supposed to be strings
     for key, value in env.as_json().items():
         assert isinstance(value, str)
+
+
+def test__Pep508Environment__evaluate_markers__evaluates_each_marker_once():
+    env = Pep508Environment.current()
+    _compile_markers.cache_clear()
+
+    for _ in range(3):
+        env.evaluate_markers('os_name == "posix"')
+        env.evaluate_markers('os_name == "posix"', source="pyproject.toml")
+    assert _compile_markers.cache_info().misses == 1
+
+    assert env.evaluate_markers('extra == "docs"', {"docs"})
+    assert not env.evaluate_markers('extra == "docs"', {"dev"})
@@ -0,0 +1,6 @@
+from slap.util.external.licenses import wrap_license_text
+
+
+def test__wrap_license_text__keeps_all_words_and_blank_lines() -> None:
+    text = "one two three four five six\n\n  seven"
+    assert wrap_license_text(text, 10) == "one two\nthree four\nfive six\n\n  seven"
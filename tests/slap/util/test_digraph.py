@@ -0,0 +1,47 @@
+import pytest
+
+from slap.util.digraph import DiGraph, topological_sort
+
+
+def test__topological_sort__orders_by_sorting_key() -> None:
+    graph: DiGraph[str, None, None] = DiGraph()
+    for node_id in "dcba":
+        graph.add_node(node_id, None)
+    graph.add_edge("a", "b", None)
+    graph.add_edge("c", "b", None)
+    graph.add_edge("b", "d", None)
+
+    assert list(topological_sort(graph)) == ["c", "a", "b", "d"]
+    assert list(topological_sort(graph, sorting_key=lambda k: k)) == ["a", "c", "b", "d"]
+
+
+def test__topological_sort__raises_on_cycle() -> None:
+    graph: DiGraph[str, None, None] = DiGraph()
+    for node_id in "abc":
+        graph.add_node(node_id, None)
+    graph.add_edge("a", "b", None)
+    graph.add_edge("b", "c", None)
+    graph.add_edge("c", "b", None)
+
+    with pytest.raises(RuntimeError, match="unreached nodes"):
+        list(topological_sort(graph))
+
+
+def test__DiGraph__deleting_nodes_and_edges_updates_roots_and_leafs() -> None:
+    graph: DiGraph[str, None, None] = DiGraph()
+    for node_id in "abc":
+        graph.nodes[node_id] = None
+    graph.edges["a", "b"] = None
+    graph.edges["b", "c"] = None
+    assert set(graph.roots) == {"a"}
+    assert set(graph.leafs) == {"c"}
+
+    del graph.edges["a", "b"]
+    assert set(graph.roots) == {"a", "b"}
+    assert set(graph.leafs) == {"a", "c"}
+    assert set(graph.successors("a")) == set()
+
+    del graph.nodes["b"]
+    assert set(graph.roots) == {"a", "c"}
+    assert set(graph.leafs) == {"a", "c"}
+    assert dict(graph.edges) == {}